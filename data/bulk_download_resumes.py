@@ -6,12 +6,17 @@ Downloads hundreds of resume templates from open-source GitHub repositories
 import requests
 import os
 import subprocess
+import sys
 import time
 from pathlib import Path
 import shutil
 from typing import Set, List
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.file_scan import iter_resume_files
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -121,8 +126,8 @@ class ResumeDatasetDownloader:
                         logger.warning(f"   ✗ Clone failed: {result.stderr[:100]}")
                         continue
                 
-                # Find and extract PDF files
-                pdf_files = list(clone_path.rglob("*.pdf"))
+                # Find and extract PDF files (one scandir walk of the clone)
+                pdf_files = list(iter_resume_files(clone_path, ('.pdf',)))
                 
                 if pdf_files:
                     logger.info(f"   ✓ Found {len(pdf_files)} PDF files")
@@ -130,17 +135,22 @@ class ResumeDatasetDownloader:
                     # Copy PDFs to our dataset
                     for pdf_file in pdf_files:
                         # Skip large files (>5MB - probably not resumes)
-                        if pdf_file.stat().st_size > 5 * 1024 * 1024:
+                        size = pdf_file.stat().st_size
+                        if size > 5 * 1024 * 1024:
                             continue
                         
                         # Create unique filename
                         new_name = f"{repo_name}_{pdf_file.name}"
                         dest = self.output_dir / new_name
                         
-                        # Copy file
-                        shutil.copy2(pdf_file, dest)
+                        # Hardlink when possible (the clone is deleted right after,
+                        # so the data just changes owner); copy across devices
+                        try:
+                            os.link(pdf_file, dest)
+                        except OSError:
+                            shutil.copy2(pdf_file, dest)
                         self.pdfs_extracted += 1
-                        logger.info(f"      → Extracted: {new_name} ({pdf_file.stat().st_size / 1024:.1f} KB)")
+                        logger.debug("      → Extracted: %s (%.1f KB)", new_name, size / 1024)
                 else:
                     logger.info(f"   ⚠ No PDFs found")
                 
@@ -219,7 +229,7 @@ class ResumeDatasetDownloader:
                         filename = f"{repo['name']}_{Path(pdf_path).name}"
                         dest = direct_dir / filename
                         dest.write_bytes(response.content)
-                        logger.info(f"   ✓ Downloaded: {filename} ({len(response.content) / 1024:.1f} KB)")
+                        logger.debug("   ✓ Downloaded: %s (%.1f KB)", filename, len(response.content) / 1024)
                         self.pdfs_extracted += 1
                     else:
                         logger.warning(f"   ✗ Failed to download {pdf_path} (HTTP {response.status_code})")
@@ -264,6 +274,10 @@ class ResumeDatasetDownloader:
 
 def main():
     """Main entry point"""
+    # Per-file lines are debug output; -v/--verbose shows them
+    if '-v' in sys.argv or '--verbose' in sys.argv:
+        logger.setLevel(logging.DEBUG)
+    
     print("\n" + "="*80)
     print("RESUME DATASET BULK DOWNLOADER")
     print("="*80)
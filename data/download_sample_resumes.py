@@ -243,14 +243,14 @@ def main():
     print("DOWNLOAD SUMMARY")
     print("=" * 70)
     
-    # List downloaded files
-    files = list(SAMPLE_DIR.glob('*'))
+    # List downloaded files (scandir entries carry their file type and cache stat())
+    with os.scandir(SAMPLE_DIR) as it:
+        files = sorted((entry for entry in it if entry.is_file()), key=lambda entry: entry.name)
     if files:
         print(f"\nFiles in {SAMPLE_DIR}:")
-        for f in sorted(files):
-            if f.is_file():
-                size_kb = f.stat().st_size / 1024
-                print(f"  ✓ {f.name} ({size_kb:.1f} KB)")
+        for entry in files:
+            size_kb = entry.stat().st_size / 1024
+            print(f"  ✓ {entry.name} ({size_kb:.1f} KB)")
     else:
         print("\nNo files downloaded yet.")
     
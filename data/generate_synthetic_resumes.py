@@ -5,6 +5,7 @@ Perfect for testing, training, and development
 """
 
 import random
+from functools import lru_cache
 from pathlib import Path
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -172,20 +173,10 @@ def generate_resume_data(category: str = "software") -> dict:
     return data
 
 
-def create_pdf_resume(data: dict, output_path: Path):
-    """Create PDF resume using ReportLab"""
-    
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=letter,
-        rightMargin=0.5*inch,
-        leftMargin=0.5*inch,
-        topMargin=0.5*inch,
-        bottomMargin=0.5*inch
-    )
-    
+@lru_cache(maxsize=None)
+def _resume_styles():
+    """Stylesheet and paragraph styles shared by every generated resume"""
     styles = getSampleStyleSheet()
-    story = []
     
     # Title style
     title_style = ParagraphStyle(
@@ -219,6 +210,24 @@ def create_pdf_resume(data: dict, output_path: Path):
         borderPadding=5
     )
     
+    return styles, title_style, contact_style, section_style
+
+
+def create_pdf_resume(data: dict, output_path: Path):
+    """Create PDF resume using ReportLab"""
+    
+    doc = SimpleDocTemplate(
+        str(output_path),
+        pagesize=letter,
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch
+    )
+    
+    styles, title_style, contact_style, section_style = _resume_styles()
+    story = []
+    
     # Name
     story.append(Paragraph(data['name'].upper(), title_style))
     
@@ -5,6 +5,7 @@ No ML models loaded - just extract text and basic info
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 from collections import defaultdict
@@ -16,6 +17,7 @@ import docx
 DATA_DIR = Path("data/data")
 OUTPUT_DIR = Path("data/training")
 OUTPUT_DIR.mkdir(exist_ok=True)
+RESUME_EXTENSIONS = ('.pdf', '.doc', '.docx')
 
 CATEGORIES = [
     "ACCOUNTANT", "ADVOCATE", "AGRICULTURE", "APPAREL", "ARTS", 
@@ -26,6 +28,20 @@ CATEGORIES = [
 ]
 
 
+def find_resume_files(root):
+    """Resume files under root, found in one os.scandir walk"""
+    found = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                found.extend(find_resume_files(entry.path))
+            else:
+                name = entry.name
+                if name.endswith(RESUME_EXTENSIONS) or name.lower().endswith(RESUME_EXTENSIONS):
+                    found.append(Path(entry.path))
+    return sorted(found)
+
+
 def extract_text_pdf(file_path):
     """Extract text from PDF"""
     try:
@@ -77,9 +93,7 @@ def main():
         if not category_path.exists():
             continue
         
-        files = list(category_path.glob("**/*.[pP][dD][fF]")) + \
-                list(category_path.glob("**/*.[dD][oO][cC]")) + \
-                list(category_path.glob("**/*.[dD][oO][cC][xX]"))
+        files = find_resume_files(category_path)
         
         resume_files[category] = [str(f) for f in files]
         total_files += len(files)
@@ -98,36 +112,37 @@ def main():
         "by_category": defaultdict(lambda: {"success": 0, "failed": 0})
     }
     
-    for category, files in resume_files.items():
-        print(f"\n[*] Processing {category} ({len(files)} files)...")
-        
-        for file_path in tqdm(files, desc=f"   {category}"):
-            stats["total"] += 1
+    # Extraction is independent per file and CPU-bound, so spread it over
+    # processes; map() keeps results in file order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for category, files in resume_files.items():
+            print(f"\n[*] Processing {category} ({len(files)} files)...")
             
-            try:
-                # Extract text
-                text = extract_text(file_path)
-                
-                if not text or len(text) < 100:
-                    raise Exception("Text too short or empty")
-                
-                # Basic data structure
-                data = {
-                    "category": category,
-                    "file_path": file_path,
-                    "text": text,
-                    "text_length": len(text),
-                    "word_count": len(text.split()),
-                    "extracted_at": datetime.now().isoformat()
-                }
-                
-                extracted_data.append(data)
-                stats["success"] += 1
-                stats["by_category"][category]["success"] += 1
+            texts = pool.map(extract_text, files, chunksize=4)
+            for file_path, text in tqdm(zip(files, texts), total=len(files), desc=f"   {category}"):
+                stats["total"] += 1
                 
-            except Exception as e:
-                stats["failed"] += 1
-                stats["by_category"][category]["failed"] += 1
+                try:
+                    if not text or len(text) < 100:
+                        raise Exception("Text too short or empty")
+                    
+                    # Basic data structure
+                    data = {
+                        "category": category,
+                        "file_path": file_path,
+                        "text": text,
+                        "text_length": len(text),
+                        "word_count": len(text.split()),
+                        "extracted_at": datetime.now().isoformat()
+                    }
+                    
+                    extracted_data.append(data)
+                    stats["success"] += 1
+                    stats["by_category"][category]["success"] += 1
+                    
+                except Exception as e:
+                    stats["failed"] += 1
+                    stats["by_category"][category]["failed"] += 1
     
     # Save extracted data
     print("\n[*] Saving data...")
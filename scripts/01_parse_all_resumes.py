@@ -4,7 +4,7 @@ Simple, no heavy ML imports - just parsing
 """
 
 import os
-import json
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from tqdm import tqdm
 from collections import defaultdict
@@ -15,11 +15,14 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.services.resume_parser import ResumeParser
+from src.utils.json_utils import dump_json
+from src.utils.file_scan import find_resume_files, list_subdirs
 
 # Configuration
 DATA_DIR = Path("data/data")
 OUTPUT_DIR = Path("data/training")
 OUTPUT_DIR.mkdir(exist_ok=True)
+PARSE_CACHE_DIR = OUTPUT_DIR / "parse_cache"  # content-hash keyed, reused across runs
 
 CATEGORIES = [
     "ACCOUNTANT", "ADVOCATE", "AGRICULTURE", "APPAREL", "ARTS", 
@@ -29,6 +32,23 @@ CATEGORIES = [
     "INFORMATION-TECHNOLOGY", "PUBLIC-RELATIONS", "SALES", "TEACHER"
 ]
 
+# One parser per worker process, built by _init_worker
+_parser = None
+
+
+def _init_worker():
+    """Build this worker's ResumeParser once (loading the extractors is slow)"""
+    global _parser
+    _parser = ResumeParser()
+
+
+def _parse_one(file_path):
+    """Parse one file in a worker; returns (result, None) or (None, error message)"""
+    try:
+        return _parser.parse_cached(file_path, PARSE_CACHE_DIR), None
+    except Exception as e:
+        return None, str(e)[:100]
+
 
 def main():
     """Parse all resumes and save to JSON"""
@@ -41,14 +61,13 @@ def main():
     resume_files = {}
     total_files = 0
     
+    category_dirs = list_subdirs(DATA_DIR)
     for category in CATEGORIES:
-        category_path = DATA_DIR / category
-        if not category_path.exists():
+        category_path = category_dirs.get(category)
+        if category_path is None:
             continue
         
-        files = list(category_path.glob("**/*.[pP][dD][fF]")) + \
-                list(category_path.glob("**/*.[dD][oO][cC]")) + \
-                list(category_path.glob("**/*.[dD][oO][cC][xX]"))
+        files = find_resume_files(category_path)
         
         resume_files[category] = [str(f) for f in files]
         total_files += len(files)
@@ -58,7 +77,6 @@ def main():
     
     # Parse all resumes
     print("\n[*] Parsing resumes...")
-    parser = ResumeParser()
     
     parsed_data = []
     stats = {
@@ -68,48 +86,46 @@ def main():
         "by_category": defaultdict(lambda: {"success": 0, "failed": 0, "errors": []})
     }
     
-    for category, files in resume_files.items():
-        print(f"\n[*] Processing {category} ({len(files)} files)...")
-        
-        for file_path in tqdm(files, desc=f"   {category}"):
-            stats["total"] += 1
+    # Parsing is CPU-bound (PDF decoding, NLP), so spread files over worker
+    # processes; map() keeps results in file order. Workers share the parse
+    # cache, whose entries and pointers are written atomically per writer
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as pool:
+        for category, files in resume_files.items():
+            print(f"\n[*] Processing {category} ({len(files)} files)...")
             
-            try:
-                # Parse resume
-                result = parser.parse(file_path)
-                
-                # Add metadata
-                result["category"] = category
-                result["file_path_original"] = file_path
-                result["parsed_at"] = datetime.now().isoformat()
-                
-                parsed_data.append(result)
-                stats["success"] += 1
-                stats["by_category"][category]["success"] += 1
+            outcomes = pool.map(_parse_one, files, chunksize=4)
+            for file_path, (result, error_msg) in tqdm(zip(files, outcomes), total=len(files), desc=f"   {category}"):
+                stats["total"] += 1
                 
-            except Exception as e:
-                error_msg = str(e)[:100]
-                stats["failed"] += 1
-                stats["by_category"][category]["failed"] += 1
-                stats["by_category"][category]["errors"].append({
-                    "file": Path(file_path).name,
-                    "error": error_msg
-                })
+                if error_msg is None:
+                    # Add metadata
+                    result["category"] = category
+                    result["file_path_original"] = file_path
+                    result["parsed_at"] = datetime.now().isoformat()
+                    
+                    parsed_data.append(result)
+                    stats["success"] += 1
+                    stats["by_category"][category]["success"] += 1
+                else:
+                    stats["failed"] += 1
+                    stats["by_category"][category]["failed"] += 1
+                    stats["by_category"][category]["errors"].append({
+                        "file": Path(file_path).name,
+                        "error": error_msg
+                    })
     
     # Save parsed data
     print("\n[*] Saving parsed data...")
     output_file = OUTPUT_DIR / "parsed_resumes_all.json"
     
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+    dump_json(parsed_data, output_file)
     
     print(f"   [OK] Saved to: {output_file}")
     print(f"   [OK] File size: {output_file.stat().st_size / 1024 / 1024:.1f} MB")
     
     # Save stats
     stats_file = OUTPUT_DIR / "parsing_stats.json"
-    with open(stats_file, "w", encoding="utf-8") as f:
-        json.dump(dict(stats), f, indent=2, default=str)
+    dump_json(dict(stats), stats_file)
     
     print(f"   [OK] Stats saved to: {stats_file}")
     
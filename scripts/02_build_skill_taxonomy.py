@@ -6,6 +6,7 @@ import json
 from pathlib import Path
 from collections import Counter, defaultdict
 from datetime import datetime
+from itertools import combinations
 from tqdm import tqdm
 
 # Configuration
@@ -45,10 +46,8 @@ def main():
             all_skills.update(skills)
             
             # Track co-occurrence
-            for i, skill1 in enumerate(skills):
-                for skill2 in skills[i+1:]:
-                    pair = tuple(sorted([skill1, skill2]))
-                    skill_cooccurrence[skill1][skill2] += 1
+            for skill1, skill2 in combinations(skills, 2):
+                skill_cooccurrence[skill1][skill2] += 1
     
     # Build taxonomy
     print("\n[*] Building taxonomy...")
@@ -2,12 +2,17 @@
 Step 3: Analyze quality patterns and section structures
 """
 
-import json
+import heapq
+import sys
 from pathlib import Path
 from collections import Counter, defaultdict
 from datetime import datetime
 from tqdm import tqdm
-import statistics
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.json_utils import dump_json, load_json
 
 # Configuration
 INPUT_FILE = Path("data/training/parsed_resumes_all.json")
@@ -22,8 +27,7 @@ def main():
     
     # Load parsed data
     print(f"\n[*] Loading data...")
-    with open(INPUT_FILE, "r", encoding="utf-8") as f:
-        parsed_data = json.load(f)
+    parsed_data = load_json(INPUT_FILE)
     
     print(f"   [OK] Loaded {len(parsed_data)} resumes")
     
@@ -44,14 +48,9 @@ def main():
             sections_by_category[category].update(sections)
             all_sections.update(sections)
         
-        # Quality
+        # Quality (only the overall score feeds the stats below)
         if "quality" in data:
-            quality = data["quality"]
-            quality_by_category[category].append({
-                "overall_score": quality.get("overall_score", 0),
-                "completeness": quality.get("completeness", 0),
-                "readability": quality.get("readability", 0),
-            })
+            quality_by_category[category].append(data["quality"].get("overall_score", 0))
         
         # Organizations
         if "organizations" in data and "all" in data["organizations"]:
@@ -79,44 +78,48 @@ def main():
     }
     
     # Calculate quality stats
-    for category, scores in quality_by_category.items():
-        if scores:
-            overall = [s["overall_score"] for s in scores]
+    for category, overall in quality_by_category.items():
+        if overall:
+            scores = np.asarray(overall, dtype=float)
             analysis["quality"]["by_category"][category] = {
-                "avg_score": statistics.mean(overall),
-                "median_score": statistics.median(overall),
-                "min_score": min(overall),
-                "max_score": max(overall),
-                "count": len(scores)
+                "avg_score": float(scores.mean()),
+                "median_score": float(np.median(scores)),
+                "min_score": float(scores.min()),
+                "max_score": float(scores.max()),
+                "count": len(overall)
             }
     
     # Save analysis
     output_file = OUTPUT_DIR / "resume_analysis.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(analysis, f, indent=2, ensure_ascii=False)
+    dump_json(analysis, output_file)
     
     print(f"\n   [OK] Saved to: {output_file}")
     
-    # Print summary
-    print("\n" + "="*70)
-    print("RESULTS")
-    print("="*70)
-    
-    print(f"\n[*] Most Common Sections:")
-    for section, count in all_sections.most_common(10):
-        print(f"   {section:30s} - {count:5d} resumes ({count/len(parsed_data)*100:.1f}%)")
+    # Print summary (built up and written with a single print)
+    summary_lines = [
+        "\n" + "="*70,
+        "RESULTS",
+        "="*70,
+        "\n[*] Most Common Sections:",
+    ]
+    summary_lines.extend(
+        f"   {section:30s} - {count:5d} resumes ({count/len(parsed_data)*100:.1f}%)"
+        for section, count in all_sections.most_common(10)
+    )
     
-    print(f"\n[*] Quality Scores by Category (Top 5):")
-    top_quality = sorted(
+    summary_lines.append("\n[*] Quality Scores by Category (Top 5):")
+    top_quality = heapq.nlargest(
+        5,
         analysis["quality"]["by_category"].items(),
-        key=lambda x: x[1]["avg_score"],
-        reverse=True
-    )[:5]
-    
-    for category, stats in top_quality:
-        print(f"   {category:30s} - Avg: {stats['avg_score']:.1f}/100")
+        key=lambda x: x[1]["avg_score"]
+    )
+    summary_lines.extend(
+        f"   {category:30s} - Avg: {stats['avg_score']:.1f}/100"
+        for category, stats in top_quality
+    )
     
-    print(f"\n[OK] Analysis complete!")
+    summary_lines.append("\n[OK] Analysis complete!")
+    print("\n".join(summary_lines))
 
 
 if __name__ == "__main__":
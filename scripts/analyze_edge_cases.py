@@ -3,6 +3,7 @@ Analyze edge cases where company/title detection failed
 to identify patterns for improvement
 """
 import json
+from collections import Counter
 from pathlib import Path
 import re
 
@@ -114,25 +115,28 @@ print("DETECTING RESUME FORMAT PATTERNS")
 print("=" * 80)
 
 # Check for different date formats in failing resumes
-date_patterns_found = {}
-for case in unknown_company[:50]:
-    text = case['text_preview']
-    
-    # Check various date patterns
-    patterns = {
-        'MM/YYYY': r'\d{2}/\d{4}',
-        'Month YYYY': r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
-        'YYYY-YYYY': r'\d{4}\s*[-–—]\s*\d{4}',
-        'MM/DD/YYYY': r'\d{1,2}/\d{1,2}/\d{4}',
-        'Present': r'(?:present|current)',
-    }
-    
-    for name, pat in patterns.items():
-        if re.search(pat, text, re.IGNORECASE):
-            date_patterns_found[name] = date_patterns_found.get(name, 0) + 1
+DATE_PATTERNS = {
+    'MM/YYYY': re.compile(r'\d{2}/\d{4}'),
+    'Month YYYY': re.compile(r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}', re.IGNORECASE),
+    'YYYY-YYYY': re.compile(r'\d{4}\s*[-–—]\s*\d{4}'),
+    'MM/DD/YYYY': re.compile(r'\d{1,2}/\d{1,2}/\d{4}'),
+    'Present': re.compile(r'(?:present|current)', re.IGNORECASE),
+}
+
+
+def iter_date_patterns(cases):
+    """Yield the name of each date pattern found in each case's text"""
+    for case in cases:
+        text = case['text_preview']
+        for name, regex in DATE_PATTERNS.items():
+            if regex.search(text):
+                yield name
+
+
+date_patterns_found = Counter(iter_date_patterns(unknown_company[:50]))
 
 print("\nDate pattern frequency in failing resumes:")
-for pat, count in sorted(date_patterns_found.items(), key=lambda x: -x[1]):
+for pat, count in date_patterns_found.most_common():
     print(f"  {pat}: {count}")
 
 # Check structure patterns
@@ -140,30 +144,32 @@ print("\n" + "=" * 80)
 print("DETECTING STRUCTURE PATTERNS IN FAILING RESUMES")
 print("=" * 80)
 
-structure_patterns = {
-    'Title first, then company': 0,
-    'Company first, then title': 0,
-    'Date first': 0,
-    'Bullet points only': 0,
-    'Table format': 0,
-    'Pipe separated': 0,
-    'City, State format': 0
-}
-
-for case in unknown_company[:100]:
-    text = case['text_preview']
-    lines = [l.strip() for l in text.split('\n') if l.strip()][:20]
-    
-    # Check patterns
-    if any('|' in l for l in lines):
-        structure_patterns['Pipe separated'] += 1
-    if any(l.startswith('•') or l.startswith('-') for l in lines):
-        structure_patterns['Bullet points only'] += 1
-    if any(re.search(r'^\d{2}/\d{4}', l) for l in lines):
-        structure_patterns['Date first'] += 1
-    if any(re.search(r',\s*[A-Z]{2}\s*$', l) for l in lines):
-        structure_patterns['City, State format'] += 1
-
-for pat, count in sorted(structure_patterns.items(), key=lambda x: -x[1]):
-    if count > 0:
-        print(f"  {pat}: {count}")
+MONTH_YEAR_START = re.compile(r'^\d{2}/\d{4}')
+CITY_STATE_END = re.compile(r',\s*[A-Z]{2}\s*$')
+
+
+def iter_structure_patterns(cases):
+    """Yield the name of each structure pattern found in each case's first lines"""
+    for case in cases:
+        lines = [l.strip() for l in case['text_preview'].split('\n') if l.strip()][:20]
+        # One pass over the lines sets all four flags
+        pipe = bullet = date_first = city_state = False
+        for l in lines:
+            pipe = pipe or '|' in l
+            bullet = bullet or l.startswith(('•', '-'))
+            date_first = date_first or bool(MONTH_YEAR_START.search(l))
+            city_state = city_state or bool(CITY_STATE_END.search(l))
+        if pipe:
+            yield 'Pipe separated'
+        if bullet:
+            yield 'Bullet points only'
+        if date_first:
+            yield 'Date first'
+        if city_state:
+            yield 'City, State format'
+
+
+structure_patterns = Counter(iter_structure_patterns(unknown_company[:100]))
+
+for pat, count in structure_patterns.most_common():
+    print(f"  {pat}: {count}")
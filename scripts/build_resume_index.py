@@ -2,8 +2,8 @@
 Build and persist FAISS index for all resumes
 This dramatically reduces cold start time from 15s to < 1s
 """
+import hashlib
 import sys
-import json
 import time
 from pathlib import Path
 from typing import List, Dict, Any
@@ -12,9 +12,10 @@ import argparse
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.ml.embedding_generator import EmbeddingGenerator
-from src.ml.vector_store import VectorStore
+# EmbeddingGenerator/VectorStore are imported inside build_index: they pull in
+# sentence-transformers and FAISS, which --help and a bad --input don't need
 from src.utils.logger import get_logger, get_metrics
+from src.utils.json_utils import load_json
 
 logger = get_logger("index_builder")
 
@@ -23,8 +24,7 @@ def load_resumes(resume_file: str) -> List[Dict[str, Any]]:
     """Load resumes from JSON file"""
     logger.info("loading_resumes", file=resume_file)
     
-    with open(resume_file, 'r', encoding='utf-8') as f:
-        resumes = json.load(f)
+    resumes = load_json(resume_file)
     
     logger.info("resumes_loaded", count=len(resumes))
     return resumes
@@ -46,6 +46,9 @@ def build_index(resumes: List[Dict[str, Any]],
     Returns:
         (embedding_generator, vector_store) tuple
     """
+    from src.ml.embedding_generator import EmbeddingGenerator
+    from src.ml.vector_store import VectorStore
+    
     logger.info("initializing_components", model=model_name)
     
     # Initialize components
@@ -74,8 +77,8 @@ def build_index(resumes: List[Dict[str, Any]],
         batch_start = time.time()
         
         try:
-            # Generate embeddings for batch
-            embeddings_list = []
+            # Build texts for the batch, then embed them in one encode call
+            texts = []
             metadata_list = []
             
             for resume in batch:
@@ -122,12 +125,9 @@ def build_index(resumes: List[Dict[str, Any]],
                     
                     resume_text = " | ".join(text_parts)
                     
-                    # Generate embedding
-                    embedding = embedding_gen.encode(resume_text)
-                    
                     # Prepare metadata
                     metadata = {
-                        'resume_id': resume.get('id', f"resume_{processed}"),
+                        'resume_id': resume.get('id', f"resume_{processed + len(texts)}"),
                         'name': resume.get('name', 'Unknown'),
                         'email': resume.get('email', ''),
                         'skills': skills if isinstance(skills, list) else [],
@@ -137,9 +137,8 @@ def build_index(resumes: List[Dict[str, Any]],
                         'text': resume_text
                     }
                     
-                    embeddings_list.append(embedding)
+                    texts.append(resume_text)
                     metadata_list.append(metadata)
-                    processed += 1
                     
                 except Exception as e:
                     failed += 1
@@ -148,9 +147,9 @@ def build_index(resumes: List[Dict[str, Any]],
                                  error=str(e))
             
             # Add batch to vector store
-            if embeddings_list:
-                import numpy as np
-                embeddings_batch = np.array(embeddings_list)
+            if texts:
+                embeddings_batch = embedding_gen.encode(texts, batch_size=batch_size)
+                processed += len(texts)
                 resume_ids_batch = [m['resume_id'] for m in metadata_list]
                 vector_store.add_batch(embeddings_batch, resume_ids_batch, metadata_list)
             
@@ -183,11 +182,20 @@ def build_index(resumes: List[Dict[str, Any]],
     return embedding_gen, vector_store
 
 
-def save_index(vector_store: VectorStore, output_dir: str):
+def index_signature(resume_file: str, model_name: str) -> str:
+    """Fingerprint of the inputs the saved index depends on"""
+    digest = hashlib.sha256(Path(resume_file).read_bytes())
+    digest.update(model_name.encode())
+    return digest.hexdigest()
+
+
+def save_index(vector_store: "VectorStore", output_dir: str):
     """Save FAISS index and metadata to disk"""
     logger.info("saving_index", output_dir=output_dir)
     
     start = time.time()
+    # Train IVF-PQ for large corpora once at build time; the API only loads it
+    vector_store.use_approximate_index()
     # The vector store already has storage_dir set, just use default name
     vector_store.save('resume_index')
     save_time = (time.time() - start) * 1000
@@ -222,6 +230,11 @@ def main():
         default=32,
         help='Batch size for processing'
     )
+    parser.add_argument(
+        '--rebuild',
+        action='store_true',
+        help='Rebuild even if the saved index matches the input and model'
+    )
     
     args = parser.parse_args()
     
@@ -236,6 +249,16 @@ def main():
                 batch_size=args.batch_size)
     
     try:
+        # Skip the rebuild when the saved index came from this exact input and model
+        signature = index_signature(args.input, args.model)
+        key_file = Path(args.output) / "resume_index.key"
+        index_file = Path(args.output) / "resume_index_index.faiss"
+        if (not args.rebuild and index_file.exists() and key_file.exists()
+                and key_file.read_text().strip() == signature):
+            logger.info("index_up_to_date", output_dir=args.output)
+            print(f"Index in {args.output} is up to date (use --rebuild to force)")
+            return
+        
         # Load resumes
         resumes = load_resumes(args.input)
         
@@ -249,6 +272,7 @@ def main():
         
         # Save index
         save_index(vector_store, args.output)
+        key_file.write_text(signature)
         
         # Print metrics
         metrics = get_metrics()
@@ -11,24 +11,47 @@ print("="*60)
 print("DATA QUALITY CHECK")
 print("="*60)
 
-# Check experience data
 print(f"\nTotal resumes: {len(resumes)}")
 
-has_experience = 0
-has_duration = 0
-has_title = 0
-total_exp_entries = 0
 
-for r in resumes:
-    exp = r.get('experience', [])
-    if exp:
-        has_experience += 1
-        total_exp_entries += len(exp)
-        for e in exp:
-            if e.get('duration_months') is not None:
-                has_duration += 1
-            if e.get('title'):
-                has_title += 1
+# Tally experience, skills and education properties in one pass
+def iter_quality_flags(resumes):
+    """Yield one key per data-quality property found in each resume and entry"""
+    for r in resumes:
+        exp = r.get('experience', [])
+        if exp:
+            yield 'has_experience'
+            for e in exp:
+                yield 'exp_entry'
+                if e.get('duration_months') is not None:
+                    yield 'has_duration'
+                if e.get('title'):
+                    yield 'has_title'
+        
+        skills = r.get('skills')
+        if skills:
+            yield 'has_skills'
+            if isinstance(skills, dict):
+                yield 'skills_as_dict'
+            elif isinstance(skills, list):
+                yield 'skills_as_list'
+        
+        edu = r.get('education', [])
+        if edu:
+            yield 'has_education'
+            yield from ('has_degree' for e in edu if e.get('degree'))
+
+
+flags = Counter(iter_quality_flags(resumes))
+has_experience = flags['has_experience']
+has_duration = flags['has_duration']
+has_title = flags['has_title']
+total_exp_entries = flags['exp_entry']
+has_skills = flags['has_skills']
+skills_as_dict = flags['skills_as_dict']
+skills_as_list = flags['skills_as_list']
+has_education = flags['has_education']
+has_degree = flags['has_degree']
 
 print(f"\nExperience Data Quality:")
 print(f"  Resumes with experience: {has_experience}/{len(resumes)} ({has_experience/len(resumes)*100:.1f}%)")
@@ -38,36 +61,12 @@ print(f"  Entries with title: {has_title}/{total_exp_entries} ({has_title/total_
 
 # Check skills data
 print(f"\nSkills Data Quality:")
-has_skills = 0
-skills_as_dict = 0
-skills_as_list = 0
-
-for r in resumes:
-    skills = r.get('skills')
-    if skills:
-        has_skills += 1
-        if isinstance(skills, dict):
-            skills_as_dict += 1
-        elif isinstance(skills, list):
-            skills_as_list += 1
-
 print(f"  Resumes with skills: {has_skills}/{len(resumes)} ({has_skills/len(resumes)*100:.1f}%)")
 print(f"  Skills as dict: {skills_as_dict}")
 print(f"  Skills as list: {skills_as_list}")
 
 # Check education data
 print(f"\nEducation Data Quality:")
-has_education = 0
-has_degree = 0
-
-for r in resumes:
-    edu = r.get('education', [])
-    if edu:
-        has_education += 1
-        for e in edu:
-            if e.get('degree'):
-                has_degree += 1
-
 print(f"  Resumes with education: {has_education}/{len(resumes)} ({has_education/len(resumes)*100:.1f}%)")
 
 # Sample a few resumes
@@ -13,7 +13,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import json
+import random
 import time
 from collections import Counter
 from typing import Dict, Any, List
@@ -23,8 +23,7 @@ import numpy as np
 from src.ml.match_scorer import MatchScorer
 from src.ml.candidate_ranker import CandidateRanker
 from src.ml.enhanced_skill_matcher import EnhancedSkillMatcher
-from src.ml.experience_classifier import ExperienceLevelClassifier
-from src.services.matching_engine import MatchingEngine
+from src.utils.json_utils import load_json
 
 print("="*60)
 print("🎯 IntelliMatch - Core Matching System Evaluation")
@@ -219,16 +218,8 @@ def test_match_scorer():
     return results
 
 
-def test_candidate_ranker():
-    """Test the CandidateRanker tier system"""
-    print("\n" + "="*60)
-    print("📊 TEST 3: Candidate Ranker & Tier System")
-    print("="*60)
-    
-    ranker = CandidateRanker()
-    scorer = MatchScorer()
-    
-    # Generate match scores for all candidates
+def score_sample_candidates(scorer: MatchScorer) -> List[Dict[str, Any]]:
+    """Score SAMPLE_CANDIDATES against SAMPLE_JOB in the shape CandidateRanker expects"""
     candidates_with_scores = []
     for candidate in SAMPLE_CANDIDATES:
         semantic_score = 70 if 'Python' in str(candidate['skills']) else 30
@@ -245,6 +236,20 @@ def test_candidate_ranker():
             'match_score': score,  # ranker expects 'match_score' field
             'skills': candidate['skills'].get('all_skills', [])
         })
+    return candidates_with_scores
+
+
+def test_candidate_ranker():
+    """Test the CandidateRanker tier system"""
+    print("\n" + "="*60)
+    print("📊 TEST 3: Candidate Ranker & Tier System")
+    print("="*60)
+    
+    ranker = CandidateRanker()
+    scorer = MatchScorer()
+    
+    # Generate match scores for all candidates
+    candidates_with_scores = score_sample_candidates(scorer)
     
     # Rank candidates
     ranked = ranker.rank_candidates(candidates_with_scores)
@@ -272,34 +277,23 @@ def test_candidate_ranker():
     return ranked, stats
 
 
-def test_filtering():
-    """Test advanced filtering capabilities"""
+def test_filtering(ranked: List[Dict[str, Any]] = None):
+    """
+    Test advanced filtering capabilities
+    
+    Args:
+        ranked: Candidates already scored and ranked by test_candidate_ranker;
+            scored and ranked here if not given
+    """
     print("\n" + "="*60)
     print("📊 TEST 4: Advanced Filtering")
     print("="*60)
     
     ranker = CandidateRanker()
-    scorer = MatchScorer()
-    
-    # Generate scored candidates
-    candidates_with_scores = []
-    for candidate in SAMPLE_CANDIDATES:
-        semantic_score = 70 if 'Python' in str(candidate['skills']) else 30
-        match_result = scorer.calculate_match(
-            candidate_data=candidate,
-            job_data=SAMPLE_JOB,
-            semantic_score=semantic_score
-        )
-        # Use 'final_score' key from scorer result
-        score = match_result.get('final_score', 0)
-        candidates_with_scores.append({
-            **candidate,
-            'match_score': score,  # ranker expects 'match_score' field
-            'skills': candidate['skills'].get('all_skills', [])
-        })
     
-    # Rank first
-    ranked = ranker.rank_candidates(candidates_with_scores)
+    if ranked is None:
+        # Generate scored candidates and rank them
+        ranked = ranker.rank_candidates(score_sample_candidates(MatchScorer()))
     
     # Test various filters
     filter_tests = [
@@ -334,37 +328,33 @@ def test_real_data():
     
     print(f"Loading real resume data from {parsed_data_path}...")
     
-    with open(parsed_data_path, 'r', encoding='utf-8') as f:
-        resumes = json.load(f)
+    resumes = load_json(parsed_data_path)
     
     print(f"✅ Loaded {len(resumes)} resumes")
     
-    # Analyze skill distribution
-    all_skills = []
-    experience_levels = []
+    # Count skills and experience levels as we go (no intermediate lists)
+    skill_counts = Counter()
+    exp_counts = Counter()
     
     for resume in resumes:
         skills = resume.get('skills', {})
         if isinstance(skills, dict):
             skills = skills.get('all_skills', [])
-        all_skills.extend(skills)
+        skill_counts.update(skills)
         
-        exp_level = resume.get('experience_level', 'Unknown')
-        experience_levels.append(exp_level)
+        exp_counts[resume.get('experience_level', 'Unknown')] += 1
     
     # Skill statistics
-    skill_counts = Counter(all_skills)
     print(f"\n📊 Skill Statistics:")
-    print(f"  Total skill mentions: {len(all_skills)}")
+    print(f"  Total skill mentions: {sum(skill_counts.values())}")
     print(f"  Unique skills: {len(skill_counts)}")
     print(f"\n  Top 20 Skills:")
     for skill, count in skill_counts.most_common(20):
         print(f"    {skill}: {count}")
     
     # Experience level distribution
-    exp_counts = Counter(experience_levels)
     print(f"\n📊 Experience Level Distribution:")
-    total = len(experience_levels)
+    total = len(resumes)
     for level, count in exp_counts.most_common():
         pct = count / total * 100
         bar = "█" * int(pct / 2)
@@ -390,7 +380,6 @@ def test_real_data():
     # Test matching on a sample
     print(f"\n🧪 Testing matching on 5 random resumes against Business Analyst role...")
     
-    import random
     sample_resumes = random.sample(resumes, min(5, len(resumes)))
     
     scorer = MatchScorer()
@@ -498,7 +487,8 @@ if __name__ == "__main__":
         ranker_results = None
     
     try:
-        test_filtering()
+        # Same scorer settings and inputs as the ranker test; reuse its ranking
+        test_filtering(ranker_results)
         print("\n✅ Filtering Test PASSED")
     except Exception as e:
         print(f"\n❌ Filtering Test FAILED: {e}")
@@ -2,7 +2,6 @@
 Re-parse all 2484 resumes with the enhanced experience extractor.
 Updates the stored data with improved extraction results.
 """
-import json
 import sys
 import os
 import re
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from services.extractors.enhanced_experience_extractor import EnhancedExperienceExtractor
 from services.contact_extractor import ContactExtractor
+from utils.json_utils import dump_json, load_json
 
 # Experience section headers
 EXPERIENCE_HEADERS = [
@@ -78,8 +78,7 @@ def reparse_all_resumes():
     print("RE-PARSING ALL RESUMES WITH ENHANCED EXTRACTOR")
     print("=" * 80)
     
-    with open(parsed_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(parsed_file)
     
     total = len(data)
     print(f"\nTotal resumes to process: {total}")
@@ -104,8 +103,7 @@ def reparse_all_resumes():
     # Backup original data
     backup_file = parsed_file.parent / f"parsed_resumes_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     print(f"Creating backup: {backup_file}")
-    with open(backup_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f)
+    dump_json(data, backup_file, indent=False)
     
     print("\nProcessing resumes...")
     
@@ -173,8 +171,7 @@ def reparse_all_resumes():
     
     # Save updated data
     print(f"\nSaving updated data to {parsed_file}...")
-    with open(parsed_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2)
+    dump_json(data, parsed_file)
     
     # Print summary
     print("\n" + "=" * 80)
@@ -9,10 +9,14 @@ This is NOT a simple smoke test - this is thorough validation!
 
 import sys
 import os
-import json
 import time
 import random
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from functools import lru_cache, wraps
+from io import StringIO
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Any, Tuple
@@ -20,36 +24,103 @@ from typing import Dict, List, Any, Tuple
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.ml.enhanced_skill_matcher import EnhancedSkillMatcher
-from src.ml.match_scorer import MatchScorer
-from src.ml.candidate_ranker import CandidateRanker
+try:
+    from src.ml.enhanced_skill_matcher import EnhancedSkillMatcher
+    from src.ml.match_scorer import MatchScorer
+    from src.ml.candidate_ranker import CandidateRanker
+    from src.utils.json_utils import load_json
+except ImportError as e:
+    # Fail up front instead of partway through a suite run
+    print(f"❌ Missing dependency for system tests: {e.name or e}")
+    print("   Install the project requirements: pip install -r requirements.txt")
+    sys.exit(1)
+
+
+# Shared service instances: each EnhancedSkillMatcher with semantic matching
+# loads a SkillEmbedder, so suites reuse one instance per configuration
+_SHARED_LOCK = threading.Lock()
+
+
+def _shared(factory):
+    """Cache a factory's instances; the lock keeps concurrent suites from building one twice"""
+    cached = lru_cache(maxsize=None)(factory)
+    
+    @wraps(factory)
+    def wrapper(*args, **kwargs):
+        with _SHARED_LOCK:
+            return cached(*args, **kwargs)
+    return wrapper
+
+
+@_shared
+def get_matcher(**kwargs) -> EnhancedSkillMatcher:
+    """Return the shared EnhancedSkillMatcher for these settings"""
+    return EnhancedSkillMatcher(**kwargs)
+
+
+@_shared
+def get_scorer(**kwargs) -> MatchScorer:
+    """Return the shared MatchScorer for these weights"""
+    return MatchScorer(**kwargs)
+
+
+@_shared
+def get_ranker() -> CandidateRanker:
+    """Return the shared CandidateRanker"""
+    return CandidateRanker()
 
 # Test counters
 TESTS_RUN = 0
 TESTS_PASSED = 0
 TESTS_FAILED = 0
 FAILURES = []
+_COUNTER_LOCK = threading.Lock()
+
+
+class _ThreadStdout:
+    """stdout that sends each suite thread's prints to that thread's own buffer"""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        self._local.buffer = buffer
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._stream).write(text)
+    
+    def flush(self):
+        getattr(self._local, 'buffer', self._stream).flush()
+
+
+def _record_result(passed: bool, failure=None):
+    global TESTS_RUN, TESTS_PASSED, TESTS_FAILED
+    with _COUNTER_LOCK:
+        TESTS_RUN += 1
+        if passed:
+            TESTS_PASSED += 1
+        else:
+            TESTS_FAILED += 1
+            FAILURES.append(failure)
+
 
 def test(name: str):
     """Decorator to track test execution"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            global TESTS_RUN, TESTS_PASSED, TESTS_FAILED, FAILURES
-            TESTS_RUN += 1
             try:
                 result = func(*args, **kwargs)
                 if result is True or result is None:
-                    TESTS_PASSED += 1
+                    _record_result(True)
                     print(f"  ✅ {name}")
                     return True
                 else:
-                    TESTS_FAILED += 1
-                    FAILURES.append((name, f"Returned {result}"))
+                    _record_result(False, (name, f"Returned {result}"))
                     print(f"  ❌ {name}: {result}")
                     return False
             except Exception as e:
-                TESTS_FAILED += 1
-                FAILURES.append((name, str(e)))
+                _record_result(False, (name, str(e)))
                 print(f"  ❌ {name}: {e}")
                 return False
         return wrapper
@@ -91,7 +162,7 @@ def test_skill_matcher_edge_cases():
     print("🧪 TEST SUITE 1: Skill Matcher Edge Cases")
     print("="*70)
     
-    matcher = EnhancedSkillMatcher(use_fuzzy=True, use_semantic=True)
+    matcher = get_matcher(use_fuzzy=True, use_semantic=True)
     
     @test("Empty candidate skills returns 0%")
     def test_empty_candidate():
@@ -216,7 +287,7 @@ def test_fuzzy_matching():
     print("🧪 TEST SUITE 2: Fuzzy Matching Validation")
     print("="*70)
     
-    matcher = EnhancedSkillMatcher(use_fuzzy=True, use_semantic=False, fuzzy_threshold=85)
+    matcher = get_matcher(use_fuzzy=True, use_semantic=False, fuzzy_threshold=85)
     
     # Alias mapping tests
     alias_tests = [
@@ -279,7 +350,7 @@ def test_semantic_matching():
     print("="*70)
     
     try:
-        matcher = EnhancedSkillMatcher(use_fuzzy=False, use_semantic=True, semantic_threshold=0.65)
+        matcher = get_matcher(use_fuzzy=False, use_semantic=True, semantic_threshold=0.65)
         semantic_enabled = matcher.use_semantic
     except:
         print("  ⚠️  Semantic matching not available, skipping tests")
@@ -312,6 +383,22 @@ def test_semantic_matching():
             else:
                 assert_true(not matched, f"{c} should NOT match {r}")
         test_semantic()
+    
+    @test("Embedding cache eviction keeps skills needed by the current call")
+    def test_cache_eviction():
+        embedder = matcher.embedder
+        embedder._normalized_cache.clear()
+        embedder.MAX_CACHED_EMBEDDINGS = 3
+        try:
+            embedder.encode_normalized(['a', 'b'])
+            # 'a' is cached, 'c' and 'd' push the cache over its limit
+            embeddings = embedder.encode_normalized(['a', 'c', 'd'])
+            assert_equal(embeddings.shape[0], 3, "Rows returned after eviction")
+            assert_true('a' in embedder._normalized_cache, "Cached skill evicted mid-call")
+        finally:
+            del embedder.MAX_CACHED_EMBEDDINGS
+            embedder._normalized_cache.clear()
+    test_cache_eviction()
 
 
 # ============================================================
@@ -324,7 +411,7 @@ def test_scoring_consistency():
     print("🧪 TEST SUITE 4: Scoring Consistency")
     print("="*70)
     
-    matcher = EnhancedSkillMatcher(use_fuzzy=True, use_semantic=True)
+    matcher = get_matcher(use_fuzzy=True, use_semantic=True)
     
     @test("Same inputs give same output (deterministic)")
     def test_deterministic():
@@ -386,7 +473,7 @@ def test_match_scorer():
     print("🧪 TEST SUITE 5: Match Scorer Multi-Factor Validation")
     print("="*70)
     
-    scorer = MatchScorer(
+    scorer = get_scorer(
         skills_weight=0.40,
         experience_weight=0.20,
         education_weight=0.10,
@@ -496,7 +583,7 @@ def test_candidate_ranker():
     print("🧪 TEST SUITE 6: Candidate Ranker Validation")
     print("="*70)
     
-    ranker = CandidateRanker()
+    ranker = get_ranker()
     
     @test("Ranking is in descending order")
     def test_descending():
@@ -643,6 +730,12 @@ def test_candidate_ranker():
 # TEST SUITE 7: REAL DATA STRESS TEST
 # ============================================================
 
+def _resume_skills(resume: Dict[str, Any]) -> List[str]:
+    """Skill list of a parsed resume (skills is a dict with all_skills, or a plain list)"""
+    skills = resume.get('skills', [])
+    return skills.get('all_skills', []) if isinstance(skills, dict) else skills
+
+
 def test_real_data_stress():
     """Stress test with real resume data"""
     print("\n" + "="*70)
@@ -655,14 +748,13 @@ def test_real_data_stress():
         print("  ⚠️  No parsed_resumes_all.json found. Skipping stress test.")
         return
     
-    with open(parsed_data_path, 'r', encoding='utf-8') as f:
-        resumes = json.load(f)
+    resumes = load_json(parsed_data_path)
     
     print(f"  📊 Loaded {len(resumes)} resumes for stress testing")
     
-    matcher = EnhancedSkillMatcher(use_fuzzy=True, use_semantic=True)
-    scorer = MatchScorer()
-    ranker = CandidateRanker()
+    matcher = get_matcher(use_fuzzy=True, use_semantic=True)
+    scorer = get_scorer()
+    ranker = get_ranker()
     
     # Test jobs with different skill requirements
     test_jobs = [
@@ -719,7 +811,7 @@ def test_real_data_stress():
             candidates.append({
                 'name': resume.get('name', 'Unknown'),
                 'match_score': result['final_score'],
-                'skills': resume.get('skills', {}).get('all_skills', []) if isinstance(resume.get('skills'), dict) else resume.get('skills', [])
+                'skills': _resume_skills(resume)
             })
         
         start = time.time()
@@ -737,13 +829,10 @@ def test_real_data_stress():
         
         for resume in sample:
             result = scorer.calculate_match(resume, job, semantic_score=60)
-            skills = resume.get('skills', {})
-            if isinstance(skills, dict):
-                skills = skills.get('all_skills', [])
             candidates.append({
                 'name': resume.get('name', 'Unknown'),
                 'match_score': result['final_score'],
-                'skills': skills
+                'skills': _resume_skills(resume)
             })
         
         ranked = ranker.rank_candidates(candidates)
@@ -797,9 +886,9 @@ def test_edge_case_bombing():
     print("🧪 TEST SUITE 8: Edge Case Bombing (Chaos Testing)")
     print("="*70)
     
-    matcher = EnhancedSkillMatcher(use_fuzzy=True, use_semantic=True)
-    scorer = MatchScorer()
-    ranker = CandidateRanker()
+    matcher = get_matcher(use_fuzzy=True, use_semantic=True)
+    scorer = get_scorer()
+    ranker = get_ranker()
     
     @test("List of None values handled")
     def test_none_list():
@@ -926,8 +1015,8 @@ def test_ranking_correctness():
     print("🧪 TEST SUITE 9: Ranking Correctness Validation")
     print("="*70)
     
-    scorer = MatchScorer()
-    ranker = CandidateRanker()
+    scorer = get_scorer()
+    ranker = get_ranker()
     
     # Create candidates with known skill levels
     candidates = [
@@ -1037,45 +1126,74 @@ def main():
     
     start_time = time.time()
     
-    # Run all test suites
-    test_skill_matcher_edge_cases()
-    test_fuzzy_matching()
-    test_semantic_matching()
-    test_scoring_consistency()
-    test_match_scorer()
-    test_candidate_ranker()
-    test_real_data_stress()
-    test_edge_case_bombing()
-    test_ranking_correctness()
+    # Run all test suites concurrently; each suite's output is buffered and
+    # printed in order once every suite has finished
+    suites = [
+        test_skill_matcher_edge_cases,
+        test_fuzzy_matching,
+        test_semantic_matching,
+        test_scoring_consistency,
+        test_match_scorer,
+        test_candidate_ranker,
+        test_real_data_stress,
+        test_edge_case_bombing,
+        test_ranking_correctness,
+    ]
+    thread_stdout = _ThreadStdout(sys.stdout)
+    
+    def run_suite(suite):
+        buffer = StringIO()
+        thread_stdout.capture(buffer)
+        try:
+            suite()
+            return buffer.getvalue(), None
+        except Exception as e:
+            return buffer.getvalue(), e
+    
+    with redirect_stdout(thread_stdout), ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(run_suite, suite) for suite in suites]
+    # Suite output and the final report go to stdout in a single write
+    outputs = []
+    for future in futures:
+        output, error = future.result()
+        outputs.append(output)
+        if error is not None:
+            sys.stdout.write(''.join(outputs))
+            raise error
     
     elapsed = time.time() - start_time
     
     # Final report
-    print("\n" + "="*70)
-    print("📋 FINAL TEST REPORT")
-    print("="*70)
-    
-    print(f"\n  Total Tests Run:    {TESTS_RUN}")
-    print(f"  ✅ Tests Passed:    {TESTS_PASSED}")
-    print(f"  ❌ Tests Failed:    {TESTS_FAILED}")
-    print(f"  📊 Pass Rate:       {TESTS_PASSED/TESTS_RUN*100:.1f}%")
-    print(f"  ⏱️  Time Elapsed:    {elapsed:.2f}s")
+    lines = [
+        "\n" + "="*70,
+        "📋 FINAL TEST REPORT",
+        "="*70,
+        f"\n  Total Tests Run:    {TESTS_RUN}",
+        f"  ✅ Tests Passed:    {TESTS_PASSED}",
+        f"  ❌ Tests Failed:    {TESTS_FAILED}",
+        f"  📊 Pass Rate:       {TESTS_PASSED/TESTS_RUN*100:.1f}%",
+        f"  ⏱️  Time Elapsed:    {elapsed:.2f}s",
+    ]
     
     if FAILURES:
-        print("\n  ❌ Failed Tests:")
+        lines.append("\n  ❌ Failed Tests:")
         for name, error in FAILURES[:10]:  # Show first 10
-            print(f"    - {name}: {error[:60]}...")
+            lines.append(f"    - {name}: {error[:60]}...")
         if len(FAILURES) > 10:
-            print(f"    ... and {len(FAILURES) - 10} more")
+            lines.append(f"    ... and {len(FAILURES) - 10} more")
     
-    print("\n" + "="*70)
+    lines.append("\n" + "="*70)
     if TESTS_FAILED == 0:
-        print("🎉 ALL TESTS PASSED! System is working correctly.")
+        lines.append("🎉 ALL TESTS PASSED! System is working correctly.")
     elif TESTS_FAILED <= 5:
-        print("⚠️  MOSTLY PASSING - Minor issues detected.")
+        lines.append("⚠️  MOSTLY PASSING - Minor issues detected.")
     else:
-        print("❌ SIGNIFICANT FAILURES - System needs attention.")
-    print("="*70)
+        lines.append("❌ SIGNIFICANT FAILURES - System needs attention.")
+    lines.append("="*70)
+    
+    outputs.append("\n".join(lines) + "\n")
+    sys.stdout.write(''.join(outputs))
+    sys.stdout.flush()
     
     return TESTS_FAILED == 0
 
@@ -3,19 +3,34 @@ Upload all 2,484 resumes via API
 Uses the running backend server to parse resumes
 """
 
-import requests
+import atexit
+import sys
+import httpx
 from pathlib import Path
 from tqdm import tqdm
 from collections import defaultdict
 import json
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.file_scan import find_resume_files, list_subdirs
+
 # Configuration
 API_URL = "http://localhost:8000/api/v1/resumes/batch-upload"
 DATA_DIR = Path("data/data")
 OUTPUT_DIR = Path("data/training")
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Shared client so batch uploads reuse the same keep-alive connection.
+# httpx streams multipart file parts from disk in chunks, so a batch is never
+# held in memory as one request body.
+CLIENT = httpx.Client(
+    timeout=httpx.Timeout(300.0, connect=10.0),  # server parses the whole batch before replying
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+)
+atexit.register(CLIENT.close)
+
 CATEGORIES = [
     "ACCOUNTANT", "ADVOCATE", "AGRICULTURE", "APPAREL", "ARTS", 
     "AUTOMOBILE", "AVIATION", "BANKING", "BPO", "BUSINESS-DEVELOPMENT",
@@ -36,12 +51,13 @@ def main():
     resume_files = {}
     total_files = 0
     
+    category_dirs = list_subdirs(DATA_DIR)
     for category in CATEGORIES:
-        category_path = DATA_DIR / category
-        if not category_path.exists():
+        category_path = category_dirs.get(category)
+        if category_path is None:
             continue
         
-        files = list(category_path.glob("**/*.[pP][dD][fF]"))
+        files = find_resume_files(category_path, ('.pdf',))
         resume_files[category] = files
         total_files += len(files)
         print(f"   {category:30s} - {len(files):4d} resumes")
@@ -84,11 +100,12 @@ def main():
             
             # Upload batch
             try:
-                response = requests.post(API_URL, files=files_data)
-                
-                # Close files
-                for _, file_tuple in files_data:
-                    file_tuple[1].close()
+                try:
+                    response = CLIENT.post(API_URL, files=files_data)
+                finally:
+                    # Close files
+                    for _, file_tuple in files_data:
+                        file_tuple[1].close()
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -1,6 +1,8 @@
+import heapq
+import numpy as np
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
 from src.core.dependencies import get_db
 from src.models.analytics_event import AnalyticsEvent
 from src.models.skill import Skill
@@ -11,6 +13,34 @@ from src.models.interview import Interview
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
+# Distribution bins: values below edges[i] (and at or above edges[i-1]) fall
+# in labels[i]; anything at or above the last edge goes in the last label
+QUALITY_BIN_EDGES = (0.2, 0.4, 0.6, 0.8)
+QUALITY_BIN_LABELS = ("0.0-0.2", "0.2-0.4", "0.4-0.6", "0.6-0.8", "0.8-1.0")
+EXPERIENCE_BIN_EDGES = (2, 5, 10, 15)
+EXPERIENCE_BIN_LABELS = ("0-2 years", "2-5 years", "5-10 years", "10-15 years", "15+ years")
+
+
+def _histogram(values: np.ndarray, edges, labels) -> dict:
+    """Count values per bin with one searchsorted + bincount"""
+    counts = np.bincount(np.searchsorted(edges, values, side="right"), minlength=len(labels))
+    return {label: int(count) for label, count in zip(labels, counts)}
+
+
+def _dashboard_counts(db: Session):
+    """All dashboard counters in a single round trip (one SELECT of scalar subqueries)"""
+    def count_of(model, *criteria):
+        return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+    
+    return db.execute(select(
+        count_of(Resume, Resume.deleted_at.is_(None)).label("total_resumes"),
+        count_of(Job, Job.deleted_at.is_(None)).label("total_jobs"),
+        count_of(Match).label("total_matches"),
+        count_of(Job, Job.status == "active", Job.deleted_at.is_(None)).label("active_jobs"),
+        count_of(Interview, Interview.status == "scheduled").label("scheduled_interviews")
+    )).one()
+
+
 @router.get(
     "/stats",
     summary="Get basic statistics for dashboard",
@@ -40,32 +70,25 @@ def basic_stats(db: Session = Depends(get_db)):
     - Total candidate-job matches
     - Currently active jobs
     """
-    total_resumes = db.query(Resume).filter(Resume.deleted_at.is_(None)).count()
-    total_jobs = db.query(Job).filter(Job.deleted_at.is_(None)).count()
-    total_matches = db.query(Match).count()
-    active_jobs = db.query(Job).filter(Job.status == "active", Job.deleted_at.is_(None)).count()
+    counts = _dashboard_counts(db)
     
     return {
-        "total_resumes": total_resumes,
-        "total_jobs": total_jobs,
-        "total_matches": total_matches,
-        "active_jobs": active_jobs
+        "total_resumes": counts.total_resumes,
+        "total_jobs": counts.total_jobs,
+        "total_matches": counts.total_matches,
+        "active_jobs": counts.active_jobs
     }
 
 @router.get("/dashboard", summary="Get dashboard metrics")
 def dashboard_metrics(db: Session = Depends(get_db)):
-    total_resumes = db.query(Resume).filter(Resume.deleted_at.is_(None)).count()
-    total_jobs = db.query(Job).filter(Job.deleted_at.is_(None)).count()
-    total_matches = db.query(Match).count()
-    active_jobs = db.query(Job).filter(Job.status == "active", Job.deleted_at.is_(None)).count()
-    scheduled_interviews = db.query(Interview).filter(Interview.status == "scheduled").count()
+    counts = _dashboard_counts(db)
     
     return {
-        "total_resumes": total_resumes,
-        "total_jobs": total_jobs,
-        "active_jobs": active_jobs,
-        "total_matches": total_matches,
-        "scheduled_interviews": scheduled_interviews
+        "total_resumes": counts.total_resumes,
+        "total_jobs": counts.total_jobs,
+        "active_jobs": counts.active_jobs,
+        "total_matches": counts.total_matches,
+        "scheduled_interviews": counts.scheduled_interviews
     }
 
 @router.get(
@@ -103,23 +126,22 @@ def top_skills(
     """
     # Get most common skills across all resumes with frequency counts
     from src.models.candidate import Candidate
+    from src.models.candidate_skill import CandidateSkill
     
-    candidates = db.query(Candidate).filter(
-        Candidate.deleted_at.is_(None),
-        Candidate.skills.isnot(None)
-    ).all()
+    # Count skill frequencies in the database: one grouped query instead of
+    # loading every candidate and then its skills row by row
+    skill_name = func.lower(func.trim(Skill.name))
+    skill_counts = dict(
+        db.query(skill_name, func.count(CandidateSkill.id))
+        .join(CandidateSkill, CandidateSkill.skill_id == Skill.id)
+        .join(Candidate, Candidate.id == CandidateSkill.candidate_id)
+        .filter(Candidate.deleted_at.is_(None))
+        .group_by(skill_name)
+        .all()
+    )
     
-    # Count skill frequencies
-    skill_counts = {}
-    for candidate in candidates:
-        if candidate.skills:
-            candidate_skills = [s.strip() for s in candidate.skills.split(",")]
-            for skill in candidate_skills:
-                skill_lower = skill.lower()
-                skill_counts[skill_lower] = skill_counts.get(skill_lower, 0) + 1
-    
-    # Sort by frequency and take top N
-    top_skills_list = sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+    # Take top N by frequency without sorting every skill
+    top_skills_list = heapq.nlargest(limit, skill_counts.items(), key=lambda x: x[1])
     
     return {
         "skills": [{"name": skill, "count": count} for skill, count in top_skills_list],
@@ -222,30 +244,13 @@ def quality_distribution(db: Session = Depends(get_db)):
         Candidate.quality_score.isnot(None)
     ).all()
     
-    # Create bins for quality score distribution
-    bins = {
-        "0.0-0.2": 0,
-        "0.2-0.4": 0,
-        "0.4-0.6": 0,
-        "0.6-0.8": 0,
-        "0.8-1.0": 0
-    }
+    scores = np.fromiter((float(c.quality_score) for c in candidates), dtype=float, count=len(candidates))
     
-    for candidate in candidates:
-        score = float(candidate.quality_score)
-        if score < 0.2:
-            bins["0.0-0.2"] += 1
-        elif score < 0.4:
-            bins["0.2-0.4"] += 1
-        elif score < 0.6:
-            bins["0.4-0.6"] += 1
-        elif score < 0.8:
-            bins["0.6-0.8"] += 1
-        else:
-            bins["0.8-1.0"] += 1
+    # Bin quality scores into the distribution
+    bins = _histogram(scores, QUALITY_BIN_EDGES, QUALITY_BIN_LABELS)
     
     # Calculate average quality
-    avg_quality = sum(float(c.quality_score) for c in candidates) / len(candidates) if candidates else 0
+    avg_quality = float(scores.mean()) if candidates else 0
     
     return {
         "total_candidates": len(candidates),
@@ -266,30 +271,13 @@ def experience_distribution(db: Session = Depends(get_db)):
         Candidate.total_experience.isnot(None)
     ).all()
     
-    # Create bins for experience distribution
-    bins = {
-        "0-2 years": 0,
-        "2-5 years": 0,
-        "5-10 years": 0,
-        "10-15 years": 0,
-        "15+ years": 0
-    }
+    years = np.fromiter((float(c.total_experience) for c in candidates), dtype=float, count=len(candidates))
     
-    for candidate in candidates:
-        exp = float(candidate.total_experience)
-        if exp < 2:
-            bins["0-2 years"] += 1
-        elif exp < 5:
-            bins["2-5 years"] += 1
-        elif exp < 10:
-            bins["5-10 years"] += 1
-        elif exp < 15:
-            bins["10-15 years"] += 1
-        else:
-            bins["15+ years"] += 1
+    # Bin experience into the distribution
+    bins = _histogram(years, EXPERIENCE_BIN_EDGES, EXPERIENCE_BIN_LABELS)
     
     # Calculate average experience
-    avg_exp = sum(float(c.total_experience) for c in candidates) / len(candidates) if candidates else 0
+    avg_exp = float(years.mean()) if candidates else 0
     
     return {
         "total_candidates": len(candidates),
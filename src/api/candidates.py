@@ -1,8 +1,11 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from sqlalchemy.orm import Session
+from sqlalchemy import func
 from typing import List, Optional
 from src.core.dependencies import get_db
 from src.models.candidate import Candidate
+from src.models.candidate_skill import CandidateSkill
+from src.models.skill import Skill
 from src.models.resume import Resume
 from src.schemas.common import CandidateResponse
 from datetime import datetime
@@ -184,18 +187,33 @@ def search_candidates_by_skills(
     """
     skill_list = [s.strip().lower() for s in skills.split(",")]
     
-    candidates = db.query(Candidate).filter(Candidate.deleted_at.is_(None)).all()
+    # Fetch only the requested skills of live candidates in one query,
+    # rather than every candidate plus a lazy skills load per candidate
+    skill_name = func.lower(func.trim(Skill.name))
+    rows = (
+        db.query(CandidateSkill.candidate_id, skill_name)
+        .join(Skill, Skill.id == CandidateSkill.skill_id)
+        .join(Candidate, Candidate.id == CandidateSkill.candidate_id)
+        .filter(Candidate.deleted_at.is_(None), skill_name.in_(skill_list))
+        .all()
+    )
+    
+    skills_by_candidate = {}
+    for candidate_id, name in rows:
+        skills_by_candidate.setdefault(candidate_id, set()).add(name)
+    
+    matching_by_candidate = {}
+    for candidate_id, names in skills_by_candidate.items():
+        matching_skills = [s for s in skill_list if s in names]
+        if len(matching_skills) >= min_match:
+            matching_by_candidate[candidate_id] = matching_skills
     
     # Score each candidate by matching skills
     results = []
-    for candidate in candidates:
-        if not candidate.skills:
-            continue
-        
-        candidate_skills = [s.strip().lower() for s in candidate.skills.split(",")]
-        matching_skills = [s for s in skill_list if s in candidate_skills]
-        
-        if len(matching_skills) >= min_match:
+    if matching_by_candidate:
+        candidates = db.query(Candidate).filter(Candidate.id.in_(matching_by_candidate)).all()
+        for candidate in candidates:
+            matching_skills = matching_by_candidate[candidate.id]
             results.append({
                 "candidate": candidate,
                 "matching_skills": matching_skills,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.orm import Session
 from src.core.dependencies import get_db
 from src.models.interview import Interview
@@ -28,6 +28,7 @@ def schedule_interview(interview_data: InterviewCreate, db: Session = Depends(ge
 
 @router.get("/", response_model=List[InterviewResponse], summary="List all interviews")
 def list_interviews(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: str = Query(None),
@@ -36,6 +37,7 @@ def list_interviews(
     query = db.query(Interview)
     if status:
         query = query.filter(Interview.status == status)
+    response.headers["X-Total-Count"] = str(query.count())
     interviews = query.offset(skip).limit(limit).all()
     return interviews
 
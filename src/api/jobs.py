@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from sqlalchemy.orm import Session
 from src.core.dependencies import get_db
 from src.models.job import Job
@@ -74,6 +74,7 @@ def create_job(job: JobCreate, db: Session = Depends(get_db)):
     }
 )
 def list_jobs(
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip for pagination"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     status: str = Query(None, description="Filter by status: active, closed, or draft"),
@@ -100,6 +101,9 @@ def list_jobs(
     if location:
         query = query.filter(Job.location.ilike(f"%{location}%"))
     
+    # Total before pagination, so clients can count rows without decoding the body
+    response.headers["X-Total-Count"] = str(query.count())
+    
     jobs = query.offset(skip).limit(limit).all()
     return jobs
 
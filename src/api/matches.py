@@ -1,5 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from sqlalchemy.orm import Session, load_only
 from sqlalchemy.exc import IntegrityError
 from src.core.dependencies import get_db
 from src.models.match import Match
@@ -8,9 +8,39 @@ from src.models.resume import Resume
 from src.schemas.match import MatchCreate, MatchUpdate, MatchResponse
 from typing import List
 import datetime
+import hashlib
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/matches", tags=["Matches"])
 
+# Resumes fetched and embedded per round trip in find_matches
+INDEX_BATCH_SIZE = 100
+
+
+def _write_lines(lines: List[str]):
+    """Write buffered console lines with a single stdout call, then clear them"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def _resume_index_signature(db: Session, matcher) -> str:
+    """Fingerprint of everything the find_matches index depends on"""
+    digest = hashlib.sha256(f"{matcher.model_name}|{matcher.vector_store.size()}".encode())
+    rows = (
+        db.query(Resume.id, Resume.updated_at)
+        .filter(Resume.deleted_at.is_(None))
+        .order_by(Resume.id)
+        .yield_per(1000)
+    )
+    for resume_id, updated_at in rows:
+        digest.update(f"|{resume_id}:{updated_at}".encode())
+    return digest.hexdigest()[:16]
+
+
 @router.post("/", response_model=MatchResponse, summary="Create a match between a resume and a job")
 def create_match(match_data: MatchCreate, db: Session = Depends(get_db)):
     resume = db.query(Resume).filter(Resume.id == match_data.resume_id, Resume.deleted_at.is_(None)).first()
@@ -104,6 +134,7 @@ def create_match(match_data: MatchCreate, db: Session = Depends(get_db)):
 
 @router.get("/", response_model=List[MatchResponse], summary="List all matches")
 def list_matches(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: str = Query(None),
@@ -112,6 +143,7 @@ def list_matches(
     query = db.query(Match)
     if status:
         query = query.filter(Match.status == status)
+    response.headers["X-Total-Count"] = str(query.count())
     matches = query.offset(skip).limit(limit).all()
     return matches
 
@@ -287,52 +319,88 @@ def find_matches(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Get all active resumes
-    resumes = db.query(Resume).filter(Resume.deleted_at.is_(None)).all()
-    print(f"📋 Found {len(resumes)} resumes in database")
-    if not resumes:
+    # No active resumes: nothing to match, so skip building the engine
+    if db.query(Resume.id).filter(Resume.deleted_at.is_(None)).first() is None:
         return []
     
+    # Stream active resumes in chunks instead of materializing every row;
+    # only the columns needed for indexing are loaded
+    resumes = (
+        db.query(Resume)
+        .options(load_only(Resume.id, Resume.parsed_data_json))
+        .filter(Resume.deleted_at.is_(None))
+        .execution_options(stream_results=True)
+        .yield_per(INDEX_BATCH_SIZE)
+    )
+    
     try:
         # First index all resumes into the matching engine
         matcher = MatchingEngine()
         skill_extractor = SkillExtractor()
         
-        # Index resumes
-        indexed_count = 0
-        for resume in resumes:
-            parsed_data = resume.parsed_data_json or {}
-            
-            # Extract name from parsed data
-            name = parsed_data.get('name', 'Unknown')
-            
-            # Extract contact info from parsed data
-            contact_info = parsed_data.get('contact_info', {})
-            
-            # Check if resume has required data
-            has_text = bool(parsed_data.get('text', ''))
-            has_skills = len(parsed_data.get('skills', [])) > 0
+        # Reuse the index built for an identical set of resumes; otherwise
+        # index them now, one batched encode per chunk
+        signature = _resume_index_signature(db, matcher)
+        if matcher.load_index_snapshot("db_resumes", signature):
+            indexed_count = matcher.vector_store.size()
+        else:
+            indexed_count = 0
+            batch = []
+            report_lines = []  # per-resume status, written once per chunk
+            for resume in resumes:
+                parsed_data = resume.parsed_data_json or {}
+                
+                # Extract name from parsed data
+                name = parsed_data.get('name', 'Unknown')
+                
+                # Extract contact info from parsed data
+                contact_info = parsed_data.get('contact_info', {})
+                
+                # Check if resume has required data
+                has_text = bool(parsed_data.get('text', ''))
+                has_skills = len(parsed_data.get('skills', [])) > 0
+                
+                report_lines.append(f"   Resume {resume.id}: name={name}, text={has_text}, skills={has_skills}")
+                
+                # Ensure we have basic fields
+                resume_data = {
+                    'id': str(resume.id),
+                    'resume_id': resume.id,
+                    'name': name,
+                    'email': contact_info.get('email', ''),
+                    'phone': contact_info.get('phone', ''),
+                    'location': contact_info.get('location', ''),
+                    'skills': parsed_data.get('skills', []),
+                    'experience': parsed_data.get('experience', []),
+                    'education': parsed_data.get('education', []),
+                    'experience_years': parsed_data.get('total_years_experience', 0),
+                    'summary': parsed_data.get('summary', ''),
+                    'raw_text': parsed_data.get('text', '')
+                }
+                
+                if resume_data['raw_text']:  # Only index if we have text
+                    batch.append(resume_data)
+                
+                if len(batch) >= INDEX_BATCH_SIZE:
+                    _write_lines(report_lines)
+                    indexed_count += len(matcher.index_resumes_batch(batch))
+                    batch.clear()
             
-            print(f"   Resume {resume.id}: name={name}, text={has_text}, skills={has_skills}")
+            _write_lines(report_lines)
+            if batch:
+                indexed_count += len(matcher.index_resumes_batch(batch))
             
-            # Ensure we have basic fields
-            resume_data = {
-                'resume_id': resume.id,
-                'name': name,
-                'email': contact_info.get('email', ''),
-                'phone': contact_info.get('phone', ''),
-                'location': contact_info.get('location', ''),
-                'skills': parsed_data.get('skills', []),
-                'experience': parsed_data.get('experience', []),
-                'education': parsed_data.get('education', []),
-                'experience_years': parsed_data.get('total_years_experience', 0),
-                'summary': parsed_data.get('summary', ''),
-                'raw_text': parsed_data.get('text', '')
-            }
+            # Resumes without text add nothing, but a prebuilt index may
+            # still hold candidates
+            if not matcher.vector_store.size():
+                return []
             
-            if resume_data['raw_text']:  # Only index if we have text
-                matcher.index_resume(resume_data, resume_id=str(resume.id))
-                indexed_count += 1
+            # The snapshot is only a cache; failing to write it must not fail the match
+            # (faiss reports write errors as RuntimeError)
+            try:
+                matcher.save_index_snapshot("db_resumes", signature)
+            except (OSError, RuntimeError) as e:
+                logger.warning(f"Could not save index snapshot: {e}")
         
         print(f"✅ Indexed {indexed_count} resumes successfully")
         
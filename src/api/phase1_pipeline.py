@@ -40,7 +40,7 @@ esco_mapper = None
 skill_validator = None
 try:
     from src.ml.esco_skill_mapper import ESCOSkillMapper, SkillValidator
-    esco_mapper = ESCOSkillMapper()
+    esco_mapper = ESCOSkillMapper.load()
     skill_validator = SkillValidator(esco_mapper)
 except Exception as e:
     print(f"Warning: Could not import ESCO mapper: {e}")
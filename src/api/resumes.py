@@ -1,4 +1,4 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Response
 from sqlalchemy.orm import Session
 from src.core.dependencies import get_db
 from src.models.resume import Resume
@@ -8,8 +8,10 @@ from src.services.resume_parser import ResumeParser
 from src.services.enhanced_quality_scorer import EnhancedQualityScorer
 from src.utils.file_validation import validate_file_upload, sanitize_filename
 from typing import List, Any
+import asyncio
 import shutil
 import os
+import threading
 import json
 import logging
 from datetime import datetime, date
@@ -33,6 +35,8 @@ def make_json_serializable(obj: Any) -> Any:
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
 UPLOAD_DIR = "data/raw"
+# Files with the same bytes as an earlier parse reuse its result
+PARSE_CACHE_DIR = "data/cache/parsed"
 
 # Initialize quality scorer (singleton)
 _quality_scorer = None
@@ -41,6 +45,30 @@ def get_quality_scorer():
     if _quality_scorer is None:
         _quality_scorer = EnhancedQualityScorer()
     return _quality_scorer
+
+# Initialize resume parser (singleton) - construction loads every extractor,
+# so requests share one instance
+_resume_parser = None
+_resume_parser_lock = threading.Lock()
+def get_resume_parser():
+    global _resume_parser
+    if _resume_parser is None:
+        with _resume_parser_lock:
+            if _resume_parser is None:
+                _resume_parser = ResumeParser()
+    return _resume_parser
+
+# Sync routes and asyncio.to_thread both parse on threadpool threads, and the
+# shared extractors (spaCy, embedding caches) are not thread-safe
+_parse_lock = threading.Lock()
+def _parse_resume(file_path: str, use_cache: bool = True) -> dict:
+    """Parse a resume file with the shared parser, one call at a time"""
+    parser = get_resume_parser()
+    with _parse_lock:
+        if use_cache:
+            return parser.parse_cached(file_path, PARSE_CACHE_DIR)
+        return parser.parse(file_path)
+
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".doc"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
@@ -84,8 +112,7 @@ def get_resume_quality(resume_id: int, refresh: bool = False, db: Session = Depe
         # Re-parse from file for better quality assessment
         if os.path.exists(resume.file_path):
             try:
-                parser = ResumeParser()
-                parsed_data = parser.parse(resume.file_path)
+                parsed_data = _parse_resume(resume.file_path, use_cache=not refresh)
                 # Update stored data
                 resume.parsed_data_json = parsed_data
                 db.commit()
@@ -141,8 +168,7 @@ def get_parsed_data(resume_id: int, db: Session = Depends(get_db)):
     if not parsed_data or not parsed_data.get('skills'):
         if os.path.exists(resume.file_path):
             try:
-                parser = ResumeParser()
-                parsed_data = parser.parse(resume.file_path)
+                parsed_data = _parse_resume(resume.file_path)
                 resume.parsed_data_json = parsed_data
                 db.commit()
                 logger.info(f"Re-parsed resume {resume_id} for parsed data endpoint")
@@ -154,6 +180,7 @@ def get_parsed_data(resume_id: int, db: Session = Depends(get_db)):
 
 @router.get("/", summary="List all resumes", response_model=List[ResumeResponse])
 def list_resumes(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     status: str = None,
@@ -172,6 +199,9 @@ def list_resumes(
     if status:
         query = query.filter(Resume.status == status)
     
+    # Total before pagination, so clients can count rows without decoding the body
+    response.headers["X-Total-Count"] = str(query.count())
+    
     resumes = query.offset(skip).limit(limit).all()
     
     # Build enhanced responses
@@ -266,10 +296,9 @@ def upload_resume(file: UploadFile = File(..., description="Resume file (PDF, DO
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
     
     # Parse resume to extract data
-    parser = ResumeParser()
     try:
         logger.info(f"Parsing resume: {safe_filename}")
-        parsed_data = parser.parse(file_path)
+        parsed_data = _parse_resume(file_path)
         # Convert all datetime/date objects to strings for JSON serialization
         parsed_data = make_json_serializable(parsed_data)
         logger.info(f"Resume parsed successfully: {parsed_data.get('personal_info', {}).get('name', 'Unknown')}")
@@ -344,6 +373,12 @@ def upload_resume(file: UploadFile = File(..., description="Resume file (PDF, DO
     return response
 
 
+def _save_upload(file: UploadFile, file_path: str) -> None:
+    """Copy an uploaded file's contents to file_path"""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+
+
 @router.post("/batch-upload", summary="Upload multiple resume files")
 async def batch_upload_resumes(
     files: List[UploadFile] = File(..., description="Multiple resume files (PDF, DOC, DOCX)"),
@@ -411,12 +446,12 @@ async def batch_upload_resumes(
             safe_filename = f"{timestamp}_{file.filename}"
             file_path = os.path.join(UPLOAD_DIR, safe_filename)
             
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Disk writes and parsing are blocking; run them off the event loop
+            # so other requests keep being served while this batch is parsed
+            await asyncio.to_thread(_save_upload, file, file_path)
             
             # Parse resume
-            parser = ResumeParser()
-            parsed_data = parser.parse(file_path)
+            parsed_data = await asyncio.to_thread(_parse_resume, file_path)
             
             # Convert all datetime/date objects to strings for JSON serialization
             parsed_data = make_json_serializable(parsed_data)
@@ -548,9 +583,8 @@ def reparse_resume(resume_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Resume file not found on disk")
     
     # Re-parse
-    parser = ResumeParser()
     try:
-        parsed_data = parser.parse(resume.file_path)
+        parsed_data = _parse_resume(resume.file_path, use_cache=False)
         resume.parsed_data_json = parsed_data
         resume.status = "parsed"
         resume.updated_at = datetime.utcnow()
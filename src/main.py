@@ -1,6 +1,7 @@
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import MutableHeaders
 from src.core.config import settings
 from src.core.rate_limits import add_rate_limit_headers, clear_expired_limits
 from src.api.resumes import router as resumes_router
@@ -13,6 +14,7 @@ from src.api.analytics import router as analytics_router
 from src.api.status_notes import router as status_notes_router
 from src.api.auth import router as auth_router
 import logging
+import hashlib
 import time
 import traceback
 import uuid
@@ -113,6 +115,38 @@ async def log_requests(request: Request, call_next):
         )
         raise
 
+# Conditional GET support: repeat reads of unchanged data get a bodyless 304
+# Bodies above this size (or without a Content-Length, i.e. streamed) are
+# passed through untouched rather than buffered for hashing
+ETAG_MAX_BODY_BYTES = 1024 * 1024
+
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    """Attach a weak ETag to JSON GET responses and honour If-None-Match"""
+    response = await call_next(request)
+    
+    if (request.method != "GET" or response.status_code != 200
+            or not response.headers.get("content-type", "").startswith("application/json")):
+        return response
+    
+    content_length = response.headers.get("content-length")
+    if content_length is None or int(content_length) > ETAG_MAX_BODY_BYTES:
+        return response
+    
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+    
+    # Raw header list keeps repeated headers such as Set-Cookie
+    headers = MutableHeaders(raw=[(k, v) for k, v in response.raw_headers if k != b"content-length"])
+    headers["ETag"] = etag
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        del headers["content-type"]
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, status_code=response.status_code, headers=headers)
+
 # Add global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -138,6 +172,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Total-Count", "X-Request-ID", "ETag"],
 )
 
 # API versioning prefix
@@ -4,7 +4,8 @@ Ranks and filters candidates based on match scores
 """
 
 from typing import List, Dict, Any, Optional
-import math
+from collections import Counter
+import numpy as np
 
 
 class CandidateRanker:
@@ -100,30 +101,26 @@ class CandidateRanker:
                 'tier_distribution': {}
             }
         
-        scores = [c['match_score'] for c in candidates]
+        scores = np.fromiter((c['match_score'] for c in candidates), dtype=float, count=len(candidates))
         
-        # Calculate statistics
-        mean_score = sum(scores) / len(scores)
-        sorted_scores = sorted(scores)
-        median_score = sorted_scores[len(sorted_scores) // 2]
+        # Calculate statistics (median is the upper middle value, as before)
+        mean_score = float(scores.mean())
+        middle = len(scores) // 2
+        median_score = float(np.partition(scores, middle)[middle])
         
-        # Standard deviation
-        variance = sum((s - mean_score) ** 2 for s in scores) / len(scores)
-        std_dev = math.sqrt(variance)
+        # Standard deviation (population)
+        std_dev = float(scores.std())
         
         # Tier distribution
-        tier_dist = {}
-        for candidate in candidates:
-            tier = candidate.get('tier', 'Unknown')
-            tier_dist[tier] = tier_dist.get(tier, 0) + 1
+        tier_dist = dict(Counter(candidate.get('tier', 'Unknown') for candidate in candidates))
         
         return {
             'total': len(candidates),
             'mean_score': round(mean_score, 2),
             'median_score': round(median_score, 2),
             'std_dev': round(std_dev, 2),
-            'min_score': round(min(scores), 2),
-            'max_score': round(max(scores), 2),
+            'min_score': round(float(scores.min()), 2),
+            'max_score': round(float(scores.max()), 2),
             'tier_distribution': tier_dist
         }
     
@@ -7,6 +7,8 @@ BERT-based classifier to determine candidate experience level:
 - Expert/Lead (8+ years)
 """
 
+import hashlib
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -21,8 +23,18 @@ from dataclasses import dataclass
 import json
 import logging
 
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Quantized exports are keyed on the checkpoint they were built from
+ONNX_CACHE_DIR = Path.home() / '.cache' / 'intellimatch'
+
 
 @dataclass
 class ExperienceFeatures:
@@ -62,7 +74,8 @@ class ExperienceLevelClassifier:
                  model_name: str = 'bert-base-uncased',
                  device: Optional[str] = None,
                  use_pretrained: bool = False,
-                 model_path: Optional[str] = None):
+                 model_path: Optional[str] = None,
+                 use_onnx: bool = False):
         """
         Initialize experience classifier
         
@@ -71,11 +84,20 @@ class ExperienceLevelClassifier:
             device: Device to use ('cuda', 'cpu', or None for auto)
             use_pretrained: Load pre-trained classifier weights
             model_path: Path to saved model weights
+            use_onnx: Run inference through an INT8-quantized ONNX Runtime
+                session built from the loaded checkpoint (CPU only)
         """
         self.model_name = model_name
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
         self.num_labels = len(self.LEVELS)
         
+        # ONNX Runtime inference state
+        self.use_onnx = use_onnx
+        self._checkpoint_path: Optional[str] = None
+        self._ort_session = None
+        if use_onnx and not ONNXRUNTIME_AVAILABLE:
+            logger.warning("onnxruntime not installed. Falling back to PyTorch inference.")
+        
         # Initialize tokenizer
         print(f"🔧 Loading tokenizer: {model_name}")
         self.tokenizer = BertTokenizer.from_pretrained(model_name)
@@ -203,6 +225,37 @@ class ExperienceLevelClassifier:
         # Get ML prediction
         ml_prediction = self._predict_ml(features)
         
+        return self._combine_predictions(features, ml_prediction, use_hybrid, confidence_threshold)
+    
+    def classify_batch(self,
+                       resume_data_list: List[Dict[str, Any]],
+                       use_hybrid: bool = True,
+                       confidence_threshold: float = 0.7) -> List[Dict[str, Any]]:
+        """
+        Classify experience levels for several resumes in one forward pass
+        
+        Args:
+            resume_data_list: Parsed resume data, one dict per resume
+            use_hybrid: Use hybrid approach (ML + rule-based)
+            confidence_threshold: Minimum confidence for ML prediction
+            
+        Returns:
+            One classify()-style result per resume, in input order
+        """
+        features_list = [self._extract_features(resume_data) for resume_data in resume_data_list]
+        ml_predictions = self._predict_ml_batch(features_list)
+        
+        return [
+            self._combine_predictions(features, ml_prediction, use_hybrid, confidence_threshold)
+            for features, ml_prediction in zip(features_list, ml_predictions)
+        ]
+    
+    def _combine_predictions(self,
+                             features: ExperienceFeatures,
+                             ml_prediction: Dict[str, Any],
+                             use_hybrid: bool,
+                             confidence_threshold: float) -> Dict[str, Any]:
+        """Build the classification result, falling back to rules on low ML confidence"""
         # If hybrid mode and low confidence, use rule-based fallback
         if use_hybrid and ml_prediction['confidence'] < confidence_threshold:
             rule_prediction = self._predict_rule_based(features)
@@ -224,6 +277,85 @@ class ExperienceLevelClassifier:
             'reasoning': self._generate_reasoning(features, ml_prediction['level'])
         }
     
+    def _onnx_cache_path(self) -> Optional[Path]:
+        """Location of the quantized export for the loaded checkpoint, if any"""
+        if not self._checkpoint_path:
+            return None
+        
+        checkpoint = Path(self._checkpoint_path).resolve()
+        key = f"{checkpoint}:{checkpoint.stat().st_mtime_ns}:{self.model_name}"
+        digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return ONNX_CACHE_DIR / f"bert_exp_{digest}.int8.onnx"
+    
+    def _export_onnx(self, int8_path: Path):
+        """Export the model to ONNX and quantize its weights to INT8"""
+        int8_path.parent.mkdir(parents=True, exist_ok=True)
+        fp32_path = int8_path.with_name(f"{int8_path.stem}.{os.getpid()}.fp32.onnx")
+        tmp_path = int8_path.with_name(f"{int8_path.name}.{os.getpid()}.tmp")
+        
+        print(f"📦 Exporting classifier to ONNX: {int8_path}")
+        self.model.eval()
+        dummy = self._tokenize("experience")
+        
+        try:
+            torch.onnx.export(
+                self.model,
+                (dummy['input_ids'], dummy['attention_mask']),
+                str(fp32_path),
+                input_names=['input_ids', 'attention_mask'],
+                output_names=['logits'],
+                dynamic_axes={
+                    'input_ids': {0: 'batch', 1: 'sequence'},
+                    'attention_mask': {0: 'batch', 1: 'sequence'},
+                    'logits': {0: 'batch'}
+                },
+                opset_version=17
+            )
+            quantize_dynamic(str(fp32_path), str(tmp_path), weight_type=QuantType.QInt8)
+            os.replace(tmp_path, int8_path)
+        finally:
+            fp32_path.unlink(missing_ok=True)
+            tmp_path.unlink(missing_ok=True)
+    
+    def _get_ort_session(self):
+        """
+        ONNX Runtime session for the loaded checkpoint, or None for PyTorch
+        
+        The INT8 export happens on first use and is cached on disk, so later
+        runs against the same checkpoint only build the session.
+        """
+        if self._ort_session is not None:
+            return self._ort_session
+        
+        if not (self.use_onnx and ONNXRUNTIME_AVAILABLE):
+            return None
+        
+        int8_path = self._onnx_cache_path()
+        if int8_path is None:
+            return None
+        
+        if not int8_path.exists():
+            self._export_onnx(int8_path)
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._ort_session = ort.InferenceSession(
+            str(int8_path), options, providers=['CPUExecutionProvider']
+        )
+        return self._ort_session
+    
+    def _forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        """Compute logits with ONNX Runtime when enabled, else the PyTorch model"""
+        session = self._get_ort_session()
+        if session is None:
+            return self.model(input_ids=input_ids, attention_mask=attention_mask)
+        
+        logits = session.run(None, {
+            'input_ids': input_ids.cpu().numpy(),
+            'attention_mask': attention_mask.cpu().numpy()
+        })[0]
+        return torch.from_numpy(logits)
+    
     def _predict_ml(self, features: ExperienceFeatures) -> Dict[str, Any]:
         """ML-based prediction using BERT"""
         self.model.eval()
@@ -236,10 +368,7 @@ class ExperienceLevelClassifier:
         
         # Predict
         with torch.no_grad():
-            logits = self.model(
-                input_ids=inputs['input_ids'],
-                attention_mask=inputs['attention_mask']
-            )
+            logits = self._forward(inputs['input_ids'], inputs['attention_mask'])
             
             # Get probabilities
             probs = torch.softmax(logits, dim=1)
@@ -260,6 +389,44 @@ class ExperienceLevelClassifier:
             'probabilities': all_probs
         }
     
+    def _predict_ml_batch(self, features_list: List[ExperienceFeatures]) -> List[Dict[str, Any]]:
+        """ML-based prediction for a batch of feature sets in a single forward pass"""
+        if not features_list:
+            return []
+        
+        self.model.eval()
+        
+        texts = [self._prepare_text(f) for f in features_list]
+        
+        # Pad to the longest text in the batch rather than max_length
+        batch_inputs = self.tokenizer(
+            texts,
+            add_special_tokens=True,
+            max_length=256,
+            padding=True,
+            truncation=True,
+            return_attention_mask=True,
+            return_tensors='pt'
+        )
+        
+        with torch.inference_mode():
+            logits = self._forward(
+                batch_inputs['input_ids'].to(self.device),
+                batch_inputs['attention_mask'].to(self.device)
+            )
+            probs = torch.softmax(logits, dim=-1).cpu().tolist()
+        
+        predictions = []
+        for row in probs:
+            pred_idx = max(range(self.num_labels), key=row.__getitem__)
+            predictions.append({
+                'level': self.LEVELS[pred_idx],
+                'confidence': row[pred_idx],
+                'probabilities': dict(zip(self.LEVELS, row))
+            })
+        
+        return predictions
+    
     def _predict_rule_based(self, features: ExperienceFeatures) -> Dict[str, Any]:
         """Rule-based prediction (fallback)"""
         years = features.years
@@ -425,6 +592,10 @@ class ExperienceLevelClassifier:
         val_features = [self._extract_features(data) for data, _ in val_data]
         val_labels = [self.LEVELS.index(label) for _, label in val_data]
         
+        # Weights no longer match any exported checkpoint
+        self._checkpoint_path = None
+        self._ort_session = None
+        
         # Optimizer and scheduler
         optimizer = AdamW(self.model.parameters(), lr=learning_rate)
         total_steps = len(train_data) * epochs // batch_size
@@ -558,6 +729,9 @@ class ExperienceLevelClassifier:
         self.model.load_state_dict(checkpoint['model_state_dict'])
         self.training_history = checkpoint.get('training_history', {})
         
+        self._checkpoint_path = path
+        self._ort_session = None
+        
         print(f"📂 Model loaded from {path}")
 
 
@@ -663,16 +837,16 @@ if __name__ == "__main__":
     
     print("\n📝 Running test cases (rule-based mode)...\n")
     
+    results = classifier.classify_batch(
+        [test['resume'] for test in test_cases],
+        use_hybrid=True,
+        confidence_threshold=0.9  # Force rule-based for testing
+    )
+    
     correct = 0
-    for i, test in enumerate(test_cases, 1):
+    for i, (test, result) in enumerate(zip(test_cases, results), 1):
         print(f"{i}. {test['name']}")
         
-        result = classifier.classify(
-            test['resume'],
-            use_hybrid=True,
-            confidence_threshold=0.9  # Force rule-based for testing
-        )
-        
         level = result['level']
         confidence = result['confidence']
         method = result['method']
@@ -13,6 +13,7 @@ Edge Cases Handled:
 
 from sentence_transformers import SentenceTransformer
 from typing import List, Union, Dict, Any, Optional
+from itertools import islice
 import numpy as np
 from pathlib import Path
 import json
@@ -77,6 +78,18 @@ def _validate_text_list(texts: List[Any]) -> List[str]:
     return [_sanitize_text(t) for t in texts]
 
 
+def _experience_text(exp: Dict[str, Any]) -> str:
+    """Embedding text for one experience entry: title, company and first 5 achievements"""
+    get = exp.get
+    return f"{get('title', '')} at {get('company', '')}. " + ' '.join(islice(get('achievements', []), 5))
+
+
+def _education_text(edu: Dict[str, Any]) -> str:
+    """Embedding text for one education entry"""
+    get = edu.get
+    return f"{get('degree', '')} in {get('field_of_study', '')} from {get('institution', '')}"
+
+
 class EmbeddingGenerator:
     """Generate semantic embeddings using sentence-transformers"""
     
@@ -330,32 +343,46 @@ class EmbeddingGenerator:
             skills = skills_data
         
         if skills:
-            skills_text = ', '.join([str(s) for s in skills[:50]])
+            skills_text = ', '.join(map(str, islice(skills, 50)))
             embeddings['skills'] = self.encode(skills_text)
         
         # Experience descriptions (encode each job separately)
         if resume_data.get('experience'):
-            exp_texts = []
-            for exp in resume_data['experience']:
-                exp_text = f"{exp.get('title', '')} at {exp.get('company', '')}. "
-                exp_text += ' '.join(exp.get('achievements', [])[:5])
-                exp_texts.append(exp_text)
+            exp_texts = [_experience_text(exp) for exp in resume_data['experience']]
             
             if exp_texts:
                 embeddings['experience'] = self.encode(exp_texts)
         
         # Education summary
         if resume_data.get('education'):
-            edu_texts = []
-            for edu in resume_data['education']:
-                edu_text = f"{edu.get('degree', '')} in {edu.get('field_of_study', '')} from {edu.get('institution', '')}"
-                edu_texts.append(edu_text)
+            edu_texts = [_education_text(edu) for edu in resume_data['education']]
             
             if edu_texts:
                 embeddings['education'] = self.encode(edu_texts)
         
         return embeddings
     
+    def encode_resumes(self, resumes_data: List[Dict[str, Any]],
+                       batch_size: int = 32) -> np.ndarray:
+        """
+        Generate full-text embeddings for many resumes in one batched pass
+        
+        Only the primary (full text) embedding is computed, which is what
+        the vector store indexes.
+        
+        Args:
+            resumes_data: List of parsed resume data
+            batch_size: Batch size for the model forward pass
+            
+        Returns:
+            numpy array of shape [n_resumes, embedding_dim]
+        """
+        if not resumes_data:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        
+        texts = [self._build_resume_text(resume_data) for resume_data in resumes_data]
+        return self.encode(texts, batch_size=batch_size)
+    
     def encode_job(self, job_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
         """
         Generate embeddings for different parts of a job description
@@ -369,8 +396,7 @@ class EmbeddingGenerator:
         embeddings = {}
         
         # Full job description (primary embedding)
-        full_text = self._build_job_text(job_data)
-        embeddings['full_text'] = self.encode(full_text)
+        embeddings['full_text'] = self.encode_job_text(job_data)
         
         # Requirements
         req_skills = job_data.get('required_skills', [])
@@ -381,11 +407,26 @@ class EmbeddingGenerator:
         # Responsibilities
         responsibilities = job_data.get('responsibilities', [])
         if responsibilities:
-            resp_text = ' '.join(responsibilities[:10])
+            resp_text = ' '.join(islice(responsibilities, 10))
             embeddings['responsibilities'] = self.encode(resp_text)
         
         return embeddings
     
+    def encode_job_text(self, job_data: Dict[str, Any]) -> np.ndarray:
+        """
+        Generate only the primary (full text) embedding of a job description
+        
+        Search needs just this vector; encode_job also embeds requirements
+        and responsibilities, which costs two more forward passes.
+        
+        Args:
+            job_data: Parsed job description (from job_description_parser)
+            
+        Returns:
+            Embedding of the combined job text
+        """
+        return self.encode(self._build_job_text(job_data))
+    
     def _build_resume_text(self, resume_data: Dict[str, Any]) -> str:
         """Build comprehensive text from resume data for embedding"""
         parts = []
@@ -407,18 +448,13 @@ class EmbeddingGenerator:
             skills = skills_data
         
         if skills:
-            parts.append(f"Skills: {', '.join(skills[:50])}")
+            parts.append(f"Skills: {', '.join(islice(skills, 50))}")
         
         # Experience
-        for exp in resume_data.get('experience', [])[:5]:  # Top 5 experiences
-            exp_text = f"{exp.get('title', '')} at {exp.get('company', '')}. "
-            exp_text += ' '.join(exp.get('achievements', [])[:5])
-            parts.append(exp_text)
+        parts.extend(map(_experience_text, islice(resume_data.get('experience', []), 5)))  # Top 5 experiences
         
         # Education
-        for edu in resume_data.get('education', [])[:3]:  # Top 3 education entries
-            edu_text = f"{edu.get('degree', '')} in {edu.get('field_of_study', '')} from {edu.get('institution', '')}"
-            parts.append(edu_text)
+        parts.extend(map(_education_text, islice(resume_data.get('education', []), 3)))  # Top 3 education entries
         
         return ' '.join(parts)
     
@@ -444,7 +480,7 @@ class EmbeddingGenerator:
         # Responsibilities
         responsibilities = job_data.get('responsibilities', [])
         if responsibilities:
-            parts.append("Responsibilities: " + ' '.join(responsibilities[:10]))
+            parts.append("Responsibilities: " + ' '.join(islice(responsibilities, 10)))
         
         # Description
         if job_data.get('description'):
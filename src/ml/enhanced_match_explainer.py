@@ -33,23 +33,26 @@ class EnhancedMatchExplainer:
         scores = match_data.get('scores', {})
         details = match_data.get('details', {})
         
+        # Per-component values shared by every section below
+        stats = self._component_stats(details)
+        
         # Generate overall summary
         summary = self._generate_summary(final_score, scores)
         
         # Identify key strengths
-        strengths = self._identify_strengths(scores, details)
+        strengths = self._identify_strengths(scores, stats)
         
         # Identify concerns/gaps
-        concerns = self._identify_concerns(scores, details)
+        concerns = self._identify_concerns(scores, stats)
         
         # Generate actionable recommendations
-        recommendations = self._generate_recommendations(final_score, scores, details, concerns)
+        recommendations = self._generate_recommendations(final_score, scores, stats, concerns)
         
         # Suggest interview focus areas
-        interview_focus = self._generate_interview_focus(scores, details, concerns)
+        interview_focus = self._generate_interview_focus(scores, stats, concerns)
         
         # Confidence score
-        confidence = self._calculate_confidence(scores, details)
+        confidence = self._calculate_confidence(scores, stats)
         
         return {
             'summary': summary,
@@ -61,6 +64,25 @@ class EnhancedMatchExplainer:
             'hiring_recommendation': self._get_hiring_recommendation(final_score, confidence)
         }
     
+    def _component_stats(self, details: Dict[str, Any]) -> Dict[str, Any]:
+        """Pull the skill/experience/education values out of the match details once"""
+        skill_details = details.get('skills', {})
+        exp_details = details.get('experience', {})
+        edu_details = details.get('education', {})
+        
+        return {
+            'skills': skill_details,
+            'experience': exp_details,
+            'education': edu_details,
+            'skill_score': skill_details.get('score') or 0,  # Handle None
+            'exp_score': exp_details.get('score') or 0,
+            'edu_score': edu_details.get('score') or 0,
+            'candidate_years': exp_details.get('candidate_years') or 0,
+            'required_years': exp_details.get('required_years') or 0,
+            'required_matches': skill_details.get('required_matches', []),
+            'missing_required': skill_details.get('missing_required', [])
+        }
+    
     def _generate_summary(self, final_score: float, scores: Dict[str, float]) -> str:
         """Generate one-sentence summary"""
         # Get rating
@@ -82,13 +104,13 @@ class EnhancedMatchExplainer:
         
         return f"This is a {rating} match ({final_score:.1f}%) with {fit} alignment, particularly strong in {strongest_area}."
     
-    def _identify_strengths(self, scores: Dict[str, float], details: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_strengths(self, scores: Dict[str, float], stats: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify and explain key strengths"""
         strengths = []
         
         # Skill strengths
-        skill_details = details.get('skills', {})
-        skill_score = skill_details.get('score') or 0  # Handle None
+        skill_details = stats['skills']
+        skill_score = stats['skill_score']
         if skill_score >= 70:
             matched_count = skill_details.get('total_matched') or 0
             required_count = skill_details.get('total_required') or 0
@@ -96,15 +118,14 @@ class EnhancedMatchExplainer:
                 'area': 'Technical Skills',
                 'score': skill_score,
                 'description': f"Strong skill alignment with {matched_count}/{required_count} required skills matched",
-                'details': skill_details.get('required_matches', [])[:5]  # Top 5
+                'details': stats['required_matches'][:5]  # Top 5
             })
         
         # Experience strengths
-        exp_details = details.get('experience', {})
-        exp_score = exp_details.get('score') or 0  # Handle None
+        exp_score = stats['exp_score']
         if exp_score >= 70:
-            years = exp_details.get('candidate_years') or 0
-            required = exp_details.get('required_years') or 0
+            years = stats['candidate_years']
+            required = stats['required_years']
             if years >= required:
                 strengths.append({
                     'area': 'Experience Level',
@@ -124,10 +145,9 @@ class EnhancedMatchExplainer:
             })
         
         # Education strengths
-        edu_details = details.get('education', {})
-        edu_score = edu_details.get('score') or 0  # Handle None
+        edu_score = stats['edu_score']
         if edu_score >= 70:
-            degree_level = edu_details.get('highest_degree', 'Bachelor')
+            degree_level = stats['education'].get('highest_degree', 'Bachelor')
             strengths.append({
                 'area': 'Education',
                 'score': edu_score,
@@ -137,15 +157,14 @@ class EnhancedMatchExplainer:
         
         return strengths
     
-    def _identify_concerns(self, scores: Dict[str, float], details: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _identify_concerns(self, scores: Dict[str, float], stats: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Identify potential concerns or gaps"""
         concerns = []
         
         # Skill gaps
-        skill_details = details.get('skills', {})
-        missing_skills = skill_details.get('missing_required', [])
+        missing_skills = stats['missing_required']
         if missing_skills:
-            skill_score = skill_details.get('score') or 0  # Handle None
+            skill_score = stats['skill_score']
             concerns.append({
                 'area': 'Skill Gaps',
                 'severity': 'high' if len(missing_skills) > 3 else 'medium',
@@ -155,9 +174,8 @@ class EnhancedMatchExplainer:
             })
         
         # Experience gaps
-        exp_details = details.get('experience', {})
-        candidate_years = exp_details.get('candidate_years') or 0  # Handle None
-        required_years = exp_details.get('required_years') or 0  # Handle None
+        candidate_years = stats['candidate_years']
+        required_years = stats['required_years']
         if required_years > 0 and candidate_years < required_years * 0.7:  # Less than 70% of required
             gap = required_years - candidate_years
             concerns.append({
@@ -169,9 +187,8 @@ class EnhancedMatchExplainer:
             })
         
         # Education concerns
-        edu_details = details.get('education', {})
-        edu_score = edu_details.get('score') or 0  # Handle None
-        if edu_score < 50:
+        edu_details = stats['education']
+        if stats['edu_score'] < 50:
             concerns.append({
                 'area': 'Education',
                 'severity': 'low',
@@ -185,7 +202,7 @@ class EnhancedMatchExplainer:
     def _generate_recommendations(self, 
                                  final_score: float,
                                  scores: Dict[str, float], 
-                                 details: Dict[str, Any],
+                                 stats: Dict[str, Any],
                                  concerns: List[Dict]) -> List[str]:
         """Generate actionable recommendations"""
         recommendations = []
@@ -209,15 +226,13 @@ class EnhancedMatchExplainer:
             recommendations.append("Only consider if candidate shows exceptional potential")
         
         # Specific skill recommendations
-        skill_details = details.get('skills', {})
-        missing_critical = skill_details.get('missing_required', [])
+        missing_critical = stats['missing_required']
         if missing_critical and len(missing_critical) <= 3:
             recommendations.append(f"💡 Candidate could strengthen profile by learning: {', '.join(missing_critical[:3])}")
         
         # Experience recommendations
-        exp_details = details.get('experience', {})
-        candidate_years = exp_details.get('candidate_years') or 0  # Handle None
-        required_years = exp_details.get('required_years') or 0  # Handle None
+        candidate_years = stats['candidate_years']
+        required_years = stats['required_years']
         if required_years > 0 and candidate_years < required_years:
             recommendations.append("Consider offering mentorship program to bridge experience gap")
         
@@ -225,14 +240,13 @@ class EnhancedMatchExplainer:
     
     def _generate_interview_focus(self, 
                                   scores: Dict[str, float],
-                                  details: Dict[str, Any],
+                                  stats: Dict[str, Any],
                                   concerns: List[Dict]) -> List[Dict[str, Any]]:
         """Suggest specific areas to probe in interview"""
         focus_areas = []
         
         # Technical deep dive
-        skill_details = details.get('skills', {})
-        matched_skills = skill_details.get('required_matches', [])
+        matched_skills = stats['required_matches']
         if matched_skills:
             focus_areas.append({
                 'category': 'Technical Skills',
@@ -246,9 +260,7 @@ class EnhancedMatchExplainer:
             })
         
         # Experience depth
-        exp_details = details.get('experience', {})
-        exp_score = exp_details.get('score') or 0  # Handle None
-        if exp_score >= 60:
+        if stats['exp_score'] >= 60:
             focus_areas.append({
                 'category': 'Experience & Impact',
                 'priority': 'high',
@@ -288,7 +300,7 @@ class EnhancedMatchExplainer:
         
         return focus_areas
     
-    def _calculate_confidence(self, scores: Dict[str, float], details: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_confidence(self, scores: Dict[str, float], stats: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate confidence in the match assessment"""
         # Factors that increase confidence
         confidence_score = 50  # Base
@@ -311,8 +323,7 @@ class EnhancedMatchExplainer:
                 confidence_score += 10
         
         # Data completeness increases confidence
-        skill_details = details.get('skills', {})
-        if skill_details.get('total_matched', 0) >= 5:
+        if stats['skills'].get('total_matched', 0) >= 5:
             confidence_score += 10
         
         confidence_score = min(confidence_score, 95)  # Cap at 95%
@@ -425,16 +425,19 @@ class EnhancedSkillMatcher:
         
         # Strategy 3: Semantic matching (for synonyms and related skills)
         if self.use_semantic and self.embedder and remaining_targets:
-            for target_orig in list(remaining_targets):
-                target_norm = normalized_targets[target_orig]
-                best_cand_orig = None
-                best_sim = 0
-                
-                for cand_orig, cand_norm in normalized_candidates.items():
-                    sim = self.embedder.calculate_similarity(target_norm, cand_norm)
-                    if sim > best_sim:
-                        best_sim = sim
-                        best_cand_orig = cand_orig
+            # One similarity matrix (targets x candidates) instead of a model
+            # call per pair
+            targets = list(remaining_targets)
+            cand_origs = list(normalized_candidates.keys())
+            similarities = self.embedder.similarity_matrix(
+                [normalized_targets[t] for t in targets],
+                list(normalized_candidates.values())
+            )
+            best_indices = similarities.argmax(axis=1)
+            
+            for row, target_orig in enumerate(targets):
+                best_sim = float(similarities[row, best_indices[row]])
+                best_cand_orig = cand_origs[best_indices[row]]
                 
                 if best_sim >= self.semantic_threshold:
                     matches.append(target_orig)
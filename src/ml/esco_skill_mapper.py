@@ -9,6 +9,7 @@ This module provides functionality to:
 """
 
 import json
+import os
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from difflib import SequenceMatcher
@@ -16,6 +17,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Loaded mappers keyed by (resolved path, mtime_ns); see ESCOSkillMapper.load
+_INSTANCE_CACHE: Dict[Tuple[str, Optional[int]], "ESCOSkillMapper"] = {}
+
 
 class ESCOSkillMapper:
     """Maps extracted skills to ESCO taxonomy for validation and standardization"""
@@ -37,6 +41,31 @@ class ESCOSkillMapper:
         
         logger.info(f"Loaded {len(self.esco_skills)} ESCO skills")
     
+    @classmethod
+    def load(cls, esco_path: str = "data/skills/validated_skills.json") -> "ESCOSkillMapper":
+        """
+        Get a mapper for esco_path, reusing one already built from the same file
+        
+        Parsing the taxonomy and building the variant index is the expensive
+        part of construction; the instance is shared until the file's mtime
+        changes. Mappers are read-only after construction, so sharing is safe.
+        
+        Args:
+            esco_path: Path to ESCO skills JSON file
+        """
+        path = Path(esco_path).resolve()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        
+        key = (str(path), mtime)
+        mapper = _INSTANCE_CACHE.get(key)
+        if mapper is None:
+            mapper = cls(esco_path)
+            _INSTANCE_CACHE[key] = mapper
+        return mapper
+    
     def _load_esco_taxonomy(self):
         """Load ESCO taxonomy from JSON file"""
         try:
@@ -194,8 +223,20 @@ class ESCOSkillMapper:
         best_match = None
         best_score = 0.0
         
+        # ratio() is costly; skip keys whose cheap upper bounds (length-only,
+        # then character multiset) can't beat the current best
+        skill_len = len(skill)
+        matcher = SequenceMatcher(None, skill)
+        
         for esco_key in self.esco_skills.keys():
-            score = SequenceMatcher(None, skill, esco_key).ratio()
+            total_len = skill_len + len(esco_key)
+            length_bound = 2.0 * min(skill_len, len(esco_key)) / total_len if total_len else 1.0
+            if length_bound <= best_score:
+                continue
+            matcher.set_seq2(esco_key)
+            if matcher.quick_ratio() <= best_score:
+                continue
+            score = matcher.ratio()
             if score > best_score:
                 best_score = score
                 best_match = esco_key
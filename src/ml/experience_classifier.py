@@ -13,6 +13,7 @@ from __future__ import annotations
 import os
 import re
 import pickle
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any
 
 try:
@@ -46,6 +47,10 @@ class ExperienceLevelClassifier:
         self.clf = None
         self.le = None
 
+        # The same candidate is classified again for every job it is matched
+        # against; memoize per instance on the flattened experience text
+        self._predict_text = lru_cache(maxsize=4096)(self._predict_text_uncached)
+
         # Try to load embedder if available
         if SentenceTransformer is not None:
             try:
@@ -91,6 +96,9 @@ class ExperienceLevelClassifier:
         with open(self.MODEL_PATH, 'wb') as f:
             pickle.dump({'clf': self.clf, 'le': self.le}, f)
 
+        # Predictions from the previous model are stale
+        self._predict_text.cache_clear()
+
     def predict(self, experience: Any) -> Dict[str, Any]:
         """Predict experience level.
 
@@ -98,7 +106,11 @@ class ExperienceLevelClassifier:
         Returns: { 'level': str, 'confidence': float }
         """
         text = self._experience_to_text(experience)
+        # Copy so callers can't alter the memoized result
+        return dict(self._predict_text(text))
 
+    # ------------------ Helpers ------------------
+    def _predict_text_uncached(self, text: str) -> Dict[str, Any]:
         # If model available, use ML predictor
         if self.clf is not None and self.le is not None and self.embedder is not None:
             try:
@@ -114,7 +126,6 @@ class ExperienceLevelClassifier:
         # Fallback heuristic
         return self._heuristic_predict(text)
 
-    # ------------------ Helpers ------------------
     def _experience_to_text(self, experience: Any) -> str:
         if isinstance(experience, str):
             return experience
@@ -7,6 +7,9 @@ Enhanced with NLG templates, risk assessment, and growth potential analysis
 from typing import Dict, Any, List, Optional
 import random
 
+# Report banners, built once
+BANNER = "=" * 70
+
 
 class MatchExplainer:
     """Generate detailed explanations for candidate-job matches"""
@@ -764,72 +767,80 @@ class MatchExplainer:
         
         return "\n".join(parts)
     
-    def generate_report(self, match_result: Dict[str, Any], candidate_name: str = "Candidate") -> str:
-        """Generate a formatted text report"""
+    def _iter_report_lines(self, match_result: Dict[str, Any], candidate_name: str):
+        """Yield the lines of the formatted text report one at a time"""
         explanation = self.explain_match(match_result)
         
-        report_lines = []
-        report_lines.append("=" * 70)
-        report_lines.append(f"📊 MATCH REPORT: {candidate_name}")
-        report_lines.append("=" * 70)
+        yield BANNER
+        yield f"📊 MATCH REPORT: {candidate_name}"
+        yield BANNER
         
         # Summary
-        report_lines.append(f"\n{explanation['summary']}\n")
+        yield f"\n{explanation['summary']}\n"
         
         # Score breakdown
-        report_lines.append("📈 SCORE BREAKDOWN:")
+        yield "📈 SCORE BREAKDOWN:"
         for item in explanation['score_breakdown']:
-            report_lines.append(f"\n  {item['factor']} ({item['weight']:.0f}% weight):")
-            report_lines.append(f"    {item['bar']} {item['score']}/100 ({item['rating']})")
-            report_lines.append(f"    Contribution to final score: {item['contribution']:.1f}")
+            yield (f"\n  {item['factor']} ({item['weight']:.0f}% weight):\n"
+                   f"    {item['bar']} {item['score']}/100 ({item['rating']})\n"
+                   f"    Contribution to final score: {item['contribution']:.1f}")
         
         # Factor analysis
         if explanation['factor_analysis']:
-            report_lines.append("\n\n🔍 ANALYSIS:")
+            yield "\n\n🔍 ANALYSIS:"
             for analysis in explanation['factor_analysis']:
-                report_lines.append(f"  • {analysis}")
+                yield f"  • {analysis}"
         
         # Strengths
         if explanation['strengths']:
-            report_lines.append("\n\n✅ STRENGTHS:")
+            yield "\n\n✅ STRENGTHS:"
             for strength in explanation['strengths']:
-                report_lines.append(f"  • {strength}")
+                yield f"  • {strength}"
         
         # Weaknesses
         if explanation['weaknesses']:
-            report_lines.append("\n\n⚠️  AREAS OF CONCERN:")
+            yield "\n\n⚠️  AREAS OF CONCERN:"
             for weakness in explanation['weaknesses']:
-                report_lines.append(f"  • {weakness}")
+                yield f"  • {weakness}"
         
         # Recommendations
         if explanation['recommendations']:
-            report_lines.append("\n\n💡 RECOMMENDATIONS:")
+            yield "\n\n💡 RECOMMENDATIONS:"
             for rec in explanation['recommendations']:
-                report_lines.append(f"  {rec}")
+                yield f"  {rec}"
         
         # Detailed factors
-        report_lines.append("\n\n" + "=" * 70)
-        report_lines.append("📋 DETAILED BREAKDOWN")
-        report_lines.append("=" * 70)
+        yield "\n\n" + BANNER
+        yield "📋 DETAILED BREAKDOWN"
+        yield BANNER
         
-        report_lines.append("\n🛠️  SKILLS:")
-        report_lines.append(explanation['detailed_factors']['skills'])
+        detailed = explanation['detailed_factors']
+        yield f"\n🛠️  SKILLS:\n{detailed['skills']}"
+        yield f"\n\n💼 EXPERIENCE:\n{detailed['experience']}"
+        yield f"\n\n🎓 EDUCATION:\n{detailed['education']}"
         
-        report_lines.append("\n\n💼 EXPERIENCE:")
-        report_lines.append(explanation['detailed_factors']['experience'])
-        
-        report_lines.append("\n\n🎓 EDUCATION:")
-        report_lines.append(explanation['detailed_factors']['education'])
-        
-        report_lines.append("\n" + "=" * 70)
+        yield "\n" + BANNER
+    
+    def generate_report(self, match_result: Dict[str, Any], candidate_name: str = "Candidate") -> str:
+        """Generate a formatted text report"""
+        return "\n".join(self._iter_report_lines(match_result, candidate_name))
+    
+    def save_report(self, match_result: Dict[str, Any], path: str, candidate_name: str = "Candidate"):
+        """
+        Write the formatted text report to path line by line, without building it in memory
         
-        return "\n".join(report_lines)
+        A caller that already holds generate_report()'s string should write it directly.
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self._iter_report_lines(match_result, candidate_name):
+                f.write(line)
+                f.write("\n")
 
 
 if __name__ == "__main__":
-    print("=" * 70)
+    print(BANNER)
     print("🧪 Testing Match Explainer")
-    print("=" * 70)
+    print(BANNER)
     
     explainer = MatchExplainer()
     
@@ -906,12 +917,12 @@ if __name__ == "__main__":
         print(f"      • {strength}")
     
     # Test 2: Generate full report
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("\n2️⃣ Test: Generate full report\n")
     
     report = explainer.generate_report(match_result, candidate_name="Alice Johnson")
     print(report)
     
-    print("\n" + "=" * 70)
+    print("\n" + BANNER)
     print("✅ All tests passed!")
-    print("=" * 70)
+    print(BANNER)
@@ -16,7 +16,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 import logging
 import numpy as np
 from src.ml.enhanced_skill_matcher import EnhancedSkillMatcher
@@ -33,6 +33,9 @@ from src.ml.match_data_adapter import (
 
 logger = logging.getLogger(__name__)
 
+# Bound on MatchScorer's resume/job text embedding cache
+MAX_CACHED_TEXT_EMBEDDINGS = 10000
+
 
 def _safe_score(value: Any, default: float = 50.0, min_val: float = 0.0, max_val: float = 100.0) -> float:
     """
@@ -134,6 +137,29 @@ class MatchScorer:
         # Initialize ML classifiers (lazy loading to avoid startup delay)
         self._experience_classifier = None
         self._semantic_model = None  # Lazy load for semantic scoring
+        self._text_embeddings: Dict[str, np.ndarray] = {}  # Normalized, keyed by text
+    
+    def encode_pair(self, resume_text: str, job_text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return unit-length embeddings for a resume text and a job text
+        
+        Embeddings are cached by text, so scoring many candidates against one
+        job encodes the job text once; whatever is missing is encoded in a
+        single forward pass.
+        """
+        missing = [t for t in dict.fromkeys((resume_text, job_text)) if t not in self._text_embeddings]
+        if missing:
+            if len(self._text_embeddings) + len(missing) > MAX_CACHED_TEXT_EMBEDDINGS:
+                # Evict everything except the text this call still needs
+                kept = {t: self._text_embeddings[t] for t in (resume_text, job_text)
+                        if t in self._text_embeddings}
+                self._text_embeddings.clear()
+                self._text_embeddings.update(kept)
+            vectors = self._semantic_model.encode(
+                missing, batch_size=len(missing), convert_to_numpy=True, normalize_embeddings=True
+            )
+            self._text_embeddings.update(zip(missing, vectors))
+        return self._text_embeddings[resume_text], self._text_embeddings[job_text]
     
     def _compute_semantic_score(self, candidate_data: Dict, job_data: Dict) -> float:
         """
@@ -190,13 +216,9 @@ class MatchScorer:
             
             job_text = " | ".join(job_parts) if job_parts else "No job data"
             
-            # Compute embeddings
-            embeddings = self._semantic_model.encode([resume_text, job_text], convert_to_numpy=True)
-            
-            # Cosine similarity
-            similarity = np.dot(embeddings[0], embeddings[1]) / (
-                np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
-            )
+            # Compute embeddings (unit length, so the dot product is the cosine)
+            resume_vec, job_vec = self.encode_pair(resume_text, job_text)
+            similarity = float(np.dot(resume_vec, job_vec))
             
             # Convert to 0-100 scale (similarity is typically 0-1 for similar, can be negative)
             # Clamp to reasonable range
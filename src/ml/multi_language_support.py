@@ -57,6 +57,11 @@ COMMON_TECH = [
 
 SKILL_PATTERN = re.compile(r"\b([A-Za-z+#\.]{2,30})\b")
 
+# Per-token heuristics for extract_skill_candidates (lowercase)
+ACRONYM_TOKENS = frozenset({'sql', 'nosql', 'api', 'rest'})
+TOKEN_STOPWORDS = frozenset({'and', 'the', 'for', 'with', 'that', 'this', 'from'})
+TECH_SUFFIX_PATTERN = re.compile(r'\b\w+(?:js|sql|db|api)\b')
+
 
 def detect_language_short(text: str) -> str:
     """Return 'es' or 'fr' or 'en' or 'unknown' using lightweight heuristics."""
@@ -130,21 +135,24 @@ def extract_skill_candidates(text: str, lang: str = 'auto') -> List[str]:
     lower = text.lower()
     # First, find known tech words
     found = []
+    found_set = set()  # mirrors found for O(1) membership
     for tech in COMMON_TECH:
-        if tech in lower and tech not in found:
+        if tech in lower and tech not in found_set:
             found.append(tech)
+            found_set.add(tech)
     # Extract capitalized tokens as candidates (names like Django, React)
     # But allow multi-language, so pick tokens that look like tech (letters/numbers/+#.)
     for m in SKILL_PATTERN.finditer(text):
         token = m.group(1).strip()
         token_low = token.lower()
-        if token_low in found:
+        if token_low in found_set:
             continue
         # heuristics: if token contains mixed-case or known suffixes
-        if token[0].isupper() or token_low in ['sql','nosql','api','rest'] or re.search(r'\b\w+(?:js|sql|db|api)\b', token_low):
+        if token[0].isupper() or token_low in ACRONYM_TOKENS or TECH_SUFFIX_PATTERN.search(token_low):
             # filter out common stopwords that match pattern
-            if token_low not in ['and','the','for','with','that','this','from'] and len(token) > 1:
+            if token_low not in TOKEN_STOPWORDS and len(token) > 1:
                 found.append(token)
+                found_set.add(token)
     # normalization: unique, keep original casing where possible
     normalized = []
     seen = set()
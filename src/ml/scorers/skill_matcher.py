@@ -84,6 +84,39 @@ class SkillMatcher:
         else:
             return self._exact_match_score(candidate_skills, required_skills, optional_skills)
     
+    def batch_match_score(self,
+                          candidate_skill_sets: List[List[str]],
+                          required_skills: List[str],
+                          optional_skills: List[str] = None) -> List[Dict[str, Any]]:
+        """
+        Calculate skill match scores for several candidates against one job
+        
+        With semantic matching, every distinct skill (job and candidates) is
+        embedded in a single encode call up front; the per-candidate scores
+        then only do cached lookups and one small matrix product each.
+        
+        Args:
+            candidate_skill_sets: One list of skills per candidate
+            required_skills: Required skills from job posting
+            optional_skills: Optional/nice-to-have skills
+            
+        Returns:
+            List of calculate_match_score results, one per candidate
+        """
+        if optional_skills is None:
+            optional_skills = []
+        
+        if self.use_semantic and self.embedder:
+            all_skills = [*required_skills, *optional_skills]
+            for skills in candidate_skill_sets:
+                all_skills.extend(skills)
+            self.embedder.encode_normalized([self._normalize_skill(s) for s in all_skills])
+        
+        return [
+            self.calculate_match_score(skills, required_skills, optional_skills)
+            for skills in candidate_skill_sets
+        ]
+    
     def _normalize_skill(self, skill: str) -> str:
         """Normalize skill using alias dictionary"""
         normalized = skill.lower().strip()
@@ -97,60 +130,13 @@ class SkillMatcher:
         # Normalize skills first (expand abbreviations)
         normalized_candidates = [self._normalize_skill(s) for s in candidate_skills]
         
-        # Get semantic matches for required skills
-        required_matches = []
-        required_similarities = {}
-        missing_required = []
-        
-        for req_skill in required_skills:
-            normalized_req = self._normalize_skill(req_skill)
-            best_match = None
-            best_sim = 0
-            best_match_orig = None
-            
-            for i, cand_skill in enumerate(normalized_candidates):
-                # Calculate semantic similarity on normalized versions
-                sim = self.embedder.calculate_similarity(normalized_req, cand_skill)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_match = cand_skill
-                    best_match_orig = candidate_skills[i]  # Keep original for display
-            
-            if best_sim >= self.semantic_threshold:
-                required_matches.append(req_skill)
-                required_similarities[req_skill] = {
-                    'matched_with': best_match_orig,
-                    'similarity': round(best_sim, 3)
-                }
-            else:
-                missing_required.append(req_skill)
-        
-        # Get semantic matches for optional skills
-        optional_matches = []
-        optional_similarities = {}
-        missing_optional = []
-        
-        for opt_skill in optional_skills:
-            normalized_opt = self._normalize_skill(opt_skill)
-            best_match = None
-            best_sim = 0
-            best_match_orig = None
-            
-            for i, cand_skill in enumerate(normalized_candidates):
-                sim = self.embedder.calculate_similarity(normalized_opt, cand_skill)
-                if sim > best_sim:
-                    best_sim = sim
-                    best_match = cand_skill
-                    best_match_orig = candidate_skills[i]
-            
-            if best_sim >= self.semantic_threshold:
-                optional_matches.append(opt_skill)
-                optional_similarities[opt_skill] = {
-                    'matched_with': best_match_orig,
-                    'similarity': round(best_sim, 3)
-                }
-            else:
-                missing_optional.append(opt_skill)
+        # Get semantic matches for required and optional skills
+        required_matches, required_similarities, missing_required = self._best_semantic_matches(
+            required_skills, normalized_candidates, candidate_skills
+        )
+        optional_matches, optional_similarities, missing_optional = self._best_semantic_matches(
+            optional_skills, normalized_candidates, candidate_skills
+        )
         
         # Calculate coverage
         required_coverage = (len(required_matches) / len(required_skills) * 100) if required_skills else 100
@@ -180,6 +166,49 @@ class SkillMatcher:
             'matching_method': 'semantic'
         }
     
+    def _best_semantic_matches(self,
+                               target_skills: List[str],
+                               normalized_candidates: List[str],
+                               candidate_skills: List[str]):
+        """
+        Match each target skill to its most similar candidate skill
+        
+        Uses one similarity matrix (targets x candidates) from the embedder's
+        cache, so each distinct skill string is encoded once rather than
+        once per pair.
+        
+        Returns:
+            (matched targets, {target: match details}, missing targets)
+        """
+        matches = []
+        similarities = {}
+        missing = []
+        
+        if not target_skills:
+            return matches, similarities, missing
+        if not normalized_candidates:
+            return matches, similarities, list(target_skills)
+        
+        # Calculate semantic similarity on normalized versions
+        sim_matrix = self.embedder.similarity_matrix(
+            [self._normalize_skill(s) for s in target_skills],
+            normalized_candidates
+        )
+        best_indices = sim_matrix.argmax(axis=1)
+        
+        for row, target in enumerate(target_skills):
+            best_sim = float(sim_matrix[row, best_indices[row]])
+            if best_sim >= self.semantic_threshold:
+                matches.append(target)
+                similarities[target] = {
+                    'matched_with': candidate_skills[best_indices[row]],  # Keep original for display
+                    'similarity': round(best_sim, 3)
+                }
+            else:
+                missing.append(target)
+        
+        return matches, similarities, missing
+    
     def _exact_match_score(self,
                           candidate_skills: List[str],
                           required_skills: List[str],
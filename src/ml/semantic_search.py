@@ -65,9 +65,8 @@ class SemanticSearch:
         Returns:
             Resume ID
         """
-        # Generate embedding
-        embeddings = self.embedding_gen.encode_resume(resume_data)
-        full_embedding = embeddings['full_text']
+        # Generate embedding (full text only; section embeddings are not indexed)
+        full_embedding = self.embedding_gen.encode_resumes([resume_data])[0]
         
         # Extract metadata for quick access
         resume_id = resume_data.get('metadata', {}).get('file_name', f"resume_{self.vector_store.size()}")
@@ -100,33 +99,34 @@ class SemanticSearch:
         """
         print(f"📊 Indexing {len(resumes_data)} resumes...")
         
-        embeddings_list = []
+        if not resumes_data:
+            return []
+        
+        # Encode all resumes in one batched forward pass
+        embeddings_array = self.embedding_gen.encode_resumes(resumes_data, batch_size=32)
+        
         metadata_list = []
         resume_ids = []
+        base_index = self.vector_store.size()
         
         for i, resume_data in enumerate(resumes_data):
-            # Generate embedding
-            embeddings = self.embedding_gen.encode_resume(resume_data)
-            embeddings_list.append(embeddings['full_text'])
-            
-            # Extract metadata
-            resume_id = resume_data.get('metadata', {}).get('file_name', f"resume_{i}")
+            # Extract metadata (same shape as index_resume)
+            resume_id = resume_data.get('metadata', {}).get('file_name', f"resume_{base_index + i}")
             resume_ids.append(resume_id)
             
             metadata = {
                 'resume_id': resume_id,
-                'name': resume_data.get('personal_info', {}).get('name', 'Unknown'),
-                'email': resume_data.get('personal_info', {}).get('email', ''),
-                'skills': resume_data.get('skills', {}).get('all_skills', [])[:20],
+                'name': resume_data.get('personal_info', {}).get('name', resume_data.get('name', 'Unknown')),
+                'email': resume_data.get('personal_info', {}).get('email', resume_data.get('email', '')),
+                'skills': self._safe_extract_skills(resume_data)[:20],
                 'experience_years': self._calculate_experience_years(resume_data),
                 'education': [edu.get('degree', '') for edu in resume_data.get('education', [])],
                 'quality_score': resume_data.get('metadata', {}).get('quality_score', 0),
-                'top_skills': resume_data.get('skills', {}).get('top_skills', [])[:10],
+                'top_skills': self._safe_extract_skills(resume_data)[:10],
             }
             metadata_list.append(metadata)
         
         # Batch add to vector store
-        embeddings_array = np.array(embeddings_list)
         self.vector_store.add_batch(embeddings_array, resume_ids, metadata_list)
         
         print(f"✅ Indexed {len(resumes_data)} resumes")
@@ -135,7 +135,8 @@ class SemanticSearch:
     def search_for_job(self, 
                        job_data: Dict[str, Any],
                        k: int = 50,
-                       filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                       filters: Optional[Dict[str, Any]] = None,
+                       job_embedding: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Find matching candidates for a job
         
@@ -143,13 +144,16 @@ class SemanticSearch:
             job_data: Parsed job description
             k: Number of candidates to return
             filters: Optional filters (experience_years, skills, education)
+            job_embedding: Precomputed EmbeddingGenerator.encode_job_text(job_data),
+                to reuse one job vector across several searches
             
         Returns:
             List of matching candidates with scores
         """
-        # Generate job embedding
-        job_embeddings = self.embedding_gen.encode_job(job_data)
-        query_embedding = job_embeddings['full_text']
+        # Generate job embedding (only the full-text vector is searched)
+        if job_embedding is None:
+            job_embedding = self.embedding_gen.encode_job_text(job_data)
+        query_embedding = job_embedding
         
         # Create filter function if filters provided
         filter_fn = None
@@ -223,6 +227,12 @@ class SemanticSearch:
     
     def _create_filter_function(self, filters: Dict[str, Any]) -> callable:
         """Create filter function from filter criteria"""
+        # Normalize the criteria once, not per candidate
+        required_skills = None
+        if 'required_skills' in filters:
+            required_skills = frozenset(s.lower() for s in filters['required_skills'])
+        required_degree = filters['required_degree'].lower() if 'required_degree' in filters else None
+        
         def filter_fn(metadata: Dict[str, Any]) -> bool:
             # Experience filter
             if 'min_experience_years' in filters:
@@ -236,18 +246,15 @@ class SemanticSearch:
                     return False
             
             # Skills filter (must have at least one required skill)
-            if 'required_skills' in filters:
-                candidate_skills = set(s.lower() for s in metadata.get('skills', []))
-                required_skills = set(s.lower() for s in filters['required_skills'])
-                if not candidate_skills.intersection(required_skills):
+            if required_skills is not None:
+                if not any(s.lower() in required_skills for s in metadata.get('skills', [])):
                     return False
             
             # Education filter
-            if 'required_degree' in filters:
+            if required_degree is not None:
                 degrees = metadata.get('education', [])
                 degree_str = ' '.join(degrees).lower()
-                required = filters['required_degree'].lower()
-                if required not in degree_str:
+                if required_degree not in degree_str:
                     return False
             
             # Quality score filter
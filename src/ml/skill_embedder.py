@@ -115,6 +115,9 @@ class SkillEmbedder:
         'DB': 'Database',
     }
     
+    # Upper bound on cached skill embeddings before the cache is reset
+    MAX_CACHED_EMBEDDINGS = 50000
+    
     def __init__(self, model_name: str = "all-MiniLM-L6-v2", similarity_threshold: float = 0.7):
         """
         Initialize skill embedder
@@ -139,6 +142,9 @@ class SkillEmbedder:
         logger.info(f"Computing embeddings for {len(self.all_skills)} skills...")
         self.skill_embeddings = self.model.encode(self.all_skills, convert_to_numpy=True)
         logger.info("Skill embeddings ready!")
+        
+        # Unit-normalized embeddings of arbitrary skill strings, filled on demand
+        self._normalized_cache: Dict[str, np.ndarray] = {}
     
     def extract_skills_hybrid(self, text: str, top_k: int = 50) -> List[SkillMatch]:
         """
@@ -341,6 +347,48 @@ class SkillEmbedder:
         )
         
         return float(similarity)
+    
+    def encode_normalized(self, skills: List[str]) -> np.ndarray:
+        """
+        Unit-normalized embeddings for a list of skills, one row per skill
+        
+        Skills not seen before are encoded together in one batch; results are
+        cached so repeated skills (e.g. a job's requirements) are encoded once.
+        
+        Args:
+            skills: Skill strings
+            
+        Returns:
+            Array of shape (len(skills), embedding_dim)
+        """
+        missing = list(dict.fromkeys(s for s in skills if s not in self._normalized_cache))
+        if missing:
+            if len(self._normalized_cache) + len(missing) > self.MAX_CACHED_EMBEDDINGS:
+                # Evict everything except the rows this call still needs
+                kept = {s: self._normalized_cache[s] for s in skills if s in self._normalized_cache}
+                self._normalized_cache.clear()
+                self._normalized_cache.update(kept)
+            embeddings = self.model.encode(missing, convert_to_numpy=True).astype(np.float32)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.where(norms == 0, 1.0, norms)
+            self._normalized_cache.update(zip(missing, embeddings))
+        
+        if not skills:
+            return np.zeros((0, self.skill_embeddings.shape[1]), dtype=np.float32)
+        return np.stack([self._normalized_cache[s] for s in skills])
+    
+    def similarity_matrix(self, skills_a: List[str], skills_b: List[str]) -> np.ndarray:
+        """
+        Cosine similarity between every pair of skills from two lists
+        
+        Args:
+            skills_a: First list of skills
+            skills_b: Second list of skills
+            
+        Returns:
+            Array of shape (len(skills_a), len(skills_b))
+        """
+        return self.encode_normalized(skills_a) @ self.encode_normalized(skills_b).T
 
 
 # Convenience function
@@ -8,6 +8,7 @@ import re
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from collections import Counter, defaultdict
+from itertools import combinations
 
 
 class SkillRecommendationEngine:
@@ -65,11 +66,9 @@ class SkillRecommendationEngine:
                 self.skill_frequency[skill] += 1
             
             # Update skill co-occurrence
-            skill_list = list(skills)
-            for i, skill1 in enumerate(skill_list):
-                for skill2 in skill_list[i+1:]:
-                    self.skill_cooccurrence[skill1][skill2] += 1
-                    self.skill_cooccurrence[skill2][skill1] += 1
+            for skill1, skill2 in combinations(skills, 2):
+                self.skill_cooccurrence[skill1][skill2] += 1
+                self.skill_cooccurrence[skill2][skill1] += 1
             
             # Categorize by experience level
             exp_level = self._get_experience_level(resume)
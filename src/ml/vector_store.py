@@ -60,6 +60,11 @@ class VectorStore:
     # Supported metrics
     SUPPORTED_METRICS = ['cosine', 'l2']
     
+    # Below this many vectors exact (flat) search is fast enough; above it
+    # use_approximate_index() switches to IVF-PQ. FAISS wants ~39 training
+    # points per centroid, and 8-bit PQ codebooks have 256 centroids.
+    APPROX_INDEX_MIN_VECTORS = 10000
+    
     def __init__(self, embedding_dim: int = 384, 
                  metric: str = 'cosine',
                  storage_dir: str = None):
@@ -345,6 +350,54 @@ class VectorStore:
         
         return results
     
+    def use_approximate_index(self,
+                              nlist: int = 128,
+                              m: int = 16,
+                              nbits: int = 8,
+                              nprobe: int = 8) -> bool:
+        """
+        Replace a large flat index with an IVF-PQ index for sublinear search
+        
+        The stored vectors are reconstructed from the flat index, used to train
+        the coarse quantizer and PQ codebooks, and re-added in the same order,
+        so FAISS ids (and all metadata) stay valid. Scores become approximate.
+        
+        Args:
+            nlist: Number of IVF lists (coarse clusters)
+            m: Number of PQ sub-quantizers (must divide embedding_dim)
+            nbits: Bits per PQ code
+            nprobe: IVF lists visited per query
+            
+        Returns:
+            True if the index was converted, False if it was left as is
+            (too small, already approximate, or incompatible dimension)
+        """
+        if not isinstance(self.index, faiss.IndexFlat):
+            return False
+        if self.index.ntotal < self.APPROX_INDEX_MIN_VECTORS or self.embedding_dim % m:
+            return False
+        
+        # Vectors are already L2-normalized for cosine, so inner product still applies
+        vectors = self.index.reconstruct_n(0, self.index.ntotal)
+        if self.metric == 'cosine':
+            quantizer = faiss.IndexFlatIP(self.embedding_dim)
+            faiss_metric = faiss.METRIC_INNER_PRODUCT
+        else:
+            quantizer = faiss.IndexFlatL2(self.embedding_dim)
+            faiss_metric = faiss.METRIC_L2
+        
+        index = faiss.IndexIVFPQ(quantizer, self.embedding_dim, nlist, m, nbits, faiss_metric)
+        index.train(vectors)
+        index.add(vectors)
+        index.nprobe = nprobe
+        
+        # The IVF index does not own the Python-side quantizer; keep it alive
+        self._quantizer = quantizer
+        self.index = index
+        
+        logger.info(f"Switched to IVF-PQ index: {index.ntotal} vectors, nlist={nlist}, m={m}, nprobe={nprobe}")
+        return True
+    
     def get_by_resume_id(self, resume_id: str) -> Optional[Dict[str, Any]]:
         """Get metadata for a specific resume"""
         faiss_id = self.resume_id_to_faiss_id.get(resume_id)
@@ -419,13 +472,15 @@ class VectorStore:
         print(f"   Total resumes: {self.size()}")
     
     @classmethod
-    def load(cls, name: str = 'default', storage_dir: str = None) -> 'VectorStore':
+    def load(cls, name: str = 'default', storage_dir: str = None, mmap: bool = False) -> 'VectorStore':
         """
         Load index and metadata from disk
         
         Args:
             name: Name of the index to load
             storage_dir: Directory where index is stored
+            mmap: Memory-map the index file instead of reading it into RAM
+                  (read-only use; falls back to a normal read if unsupported)
             
         Returns:
             VectorStore instance
@@ -454,7 +509,13 @@ class VectorStore:
         if not index_path.exists():
             raise FileNotFoundError(f"Index file not found: {index_path}")
         
-        instance.index = faiss.read_index(str(index_path))
+        if mmap:
+            try:
+                instance.index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+            except (AttributeError, RuntimeError):
+                instance.index = faiss.read_index(str(index_path))
+        else:
+            instance.index = faiss.read_index(str(index_path))
         
         # Restore metadata
         instance.id_to_metadata = metadata['id_to_metadata']
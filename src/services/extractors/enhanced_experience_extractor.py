@@ -155,6 +155,59 @@ class EnhancedExperienceExtractor:
         r'(?:Since|From)\s+(?:' + MONTH_NAMES + r')?\s*(\d{4})',
     ]
     
+    # Precompiled patterns for the per-line extraction helpers
+    _WHITESPACE_RE = re.compile(r'\s+')
+    _YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+    _PLACEHOLDER_MARKER_RE = re.compile(r'^company\s*name\s*[ï¼\-–—,\|\•]')
+    _PLACEHOLDER_CLEANUPS = (
+        (re.compile(r'\bCompany\s+Name\b', re.IGNORECASE), ''),
+        (re.compile(r'\bEmployer\s+Name\b', re.IGNORECASE), ''),
+        (re.compile(r'\bCity\s*,?\s*State\b', re.IGNORECASE), ''),
+        (re.compile(r'[ï¼​]+'), '-'),  # Replace unicode dash variations
+    )
+    _PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+    _LEADING_DATE_RE = re.compile(rf'^(?:{MONTH_NAMES}|\d{{1,2}}/)\s*\d{{4}}', re.IGNORECASE)
+    _DATE_RANGE_LINE_RE = re.compile(rf'\n(?=.*?{MONTH_NAMES}\s+\d{{4}}\s*(?:[-–—]|\bto\b)+)', re.IGNORECASE)
+    
+    # Title extraction
+    _TITLE_DASH_RE = re.compile(r'^([A-Za-z][A-Za-z\s]+(?:Intern|Engineer|Developer|Manager|Analyst|Designer|Director|Lead|Specialist|Coordinator|Consultant|Associate|Assistant))\s*[–—-]\s*', re.IGNORECASE)
+    _PHONE_RE = re.compile(r'^[\+\d\s\-\(\)]+$')
+    _TITLE_AFTER_DATES_RE = re.compile(r'(?:to|[-–—])\s*((?:19|20)\d{2})\s+([A-Za-z][A-Za-z\s]+?)$')
+    _DATE_SPLIT_RE = re.compile(rf'\b(?:{MONTH_NAMES}|\d{{1,2}}/)\s*\d{{4}}', re.IGNORECASE)
+    _CITY_STATE_RE = re.compile(r'^[A-Z][a-z]+,?\s*[A-Z]{2}$')
+    _JOB_TITLE_RES = tuple(re.compile(rf'\b({re.escape(title)})\b', re.IGNORECASE) for title in JOB_TITLES)
+    _MONTH_YEAR_RE = re.compile(rf'\b{MONTH_NAMES}\s+\d{{4}}', re.IGNORECASE)
+    _RANGE_TAIL_RE = re.compile(r'\s*(?:[-–—]|\bto\b)+\s*(Present|Current|Now)?\s*', re.IGNORECASE)
+    _TITLE_SEPARATOR_RE = re.compile(r'\s*[-–—to|]+\s*')
+    
+    # Company extraction
+    _DASH_COMPANY_RE = re.compile(r'[–—-]\s*([A-Z][A-Za-z\s]+(?:\([A-Z]+\))?)\s*[,\n]?$')
+    _COMPANY_ABBREV_RE = re.compile(r'^([A-Z][A-Za-z\s]+)\s*\(([A-Z]{2,6})\)\s*$')
+    _COMPANY_NAME_DATE_RE = re.compile(rf'Company\s+Name\s+(?:{MONTH_NAMES}|\d{{1,2}}/)\s*\d{{4}}', re.IGNORECASE)
+    _OFFICE_ABBREV_RE = re.compile(r'([A-Z][A-Za-z\s]+(?:Office|Department|Division|Center|Bureau|Agency|System|Service))\s*\(([A-Z]+)\)')
+    _ORG_INDICATOR_RE = re.compile(r'\b(?:Inc\.|Corp\.|LLC|Ltd\.|Hospital|University|College|Bank|Group|Institute)\b', re.IGNORECASE)
+    _AT_COMPANY_RE = re.compile(r'\bat\s+([A-Z][A-Za-z\s&,.\'-]+?)(?:\s*[,\n]|\s+(?:in|from|\d|' + MONTH_NAMES + '))', re.IGNORECASE)
+    _ORG_ABBREV_RE = re.compile(r'([A-Z][A-Za-z\s]+(?:Office|Department|Division|Center|Bureau|Agency|System|Service|Organization|Program))\s*\(([A-Z]{2,6})\)')
+    _GENERAL_ORG_RE = re.compile(r'([A-Z][A-Za-z\s]+)\s*\([A-Z]+\)')
+    _PIPE_COMPANY_RE = re.compile(r'^([A-Z][A-Za-z\s&,.\'-]+?)\s*[|•]\s*[A-Z]')
+    _LEADING_BULLET_RE = re.compile(r'^[\-–—•*\s]+')
+    _TRAILING_BULLET_RE = re.compile(r'[\-–—•*\s]+$')
+    _FOUR_DIGITS_RE = re.compile(r'\b\d{4}\b')
+    _MONTH_WORD_RE = re.compile(rf'\b{MONTH_NAMES}\b', re.IGNORECASE)
+    
+    # Location, dates and achievements
+    _LOCATION_RES = tuple(re.compile(p) for p in LOCATION_PATTERNS)
+    _CURRENT_RE = re.compile(r'\b(Present|Current|Now|Ongoing)\b', re.IGNORECASE)
+    _MONTH_RANGE_RE = re.compile(rf'({MONTH_NAMES})\s+(\d{{4}})\s*(?:[-–—]|\bto\b)+\s*(?:({MONTH_NAMES})\s+)?(\d{{4}}|Present|Current|Now)', re.IGNORECASE)
+    _NUMERIC_RANGE_RE = re.compile(r'(\d{1,2})/(\d{4})\s*(?:[-–—]|\bto\b)+\s*(\d{1,2})?/?(\d{4}|Present|Current|Now)', re.IGNORECASE)
+    _YEAR_RANGE_RE = re.compile(r'\b(\d{4})\s*(?:[-–—]|\bto\b)+\s*(\d{4}|Present|Current|Now)\b', re.IGNORECASE)
+    _BULLET_RES = tuple(re.compile(p) for p in (
+        r'^[\s]*[•●○▪▫■□◦◘◙‣⁃⦾⦿]+\s*(.+)$',
+        r'^[\s]*[-–—]\s+(.+)$',
+        r'^[\s]*\*\s+(.+)$',
+        r'^[\s]*\d+[\.)]\s*(.+)$',
+    ))
+    
     def __init__(self):
         """Initialize the enhanced extractor"""
         self.job_title_set = set(t.lower() for t in self.JOB_TITLES)
@@ -176,22 +229,19 @@ class EnhancedExperienceExtractor:
             return True
         
         # Check for "Company Name" with special characters (template markers)
-        if re.match(r'^company\s*name\s*[ï¼\-–—,\|\•]', text_clean):
+        if self._PLACEHOLDER_MARKER_RE.match(text_clean):
             return True
         
         return False
     
     def _clean_placeholder_text(self, text: str) -> str:
         """Remove placeholder patterns from text"""
-        # Remove "Company Name" placeholder patterns
-        text = re.sub(r'\bCompany\s+Name\b', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'\bEmployer\s+Name\b', '', text, flags=re.IGNORECASE)
-        # Remove City, State placeholders
-        text = re.sub(r'\bCity\s*,?\s*State\b', '', text, flags=re.IGNORECASE)
-        # Clean up special unicode characters often used as separators
-        text = re.sub(r'[ï¼​]+', '-', text)  # Replace unicode dash variations
+        # Remove "Company Name"/"Employer Name"/"City, State" placeholders and
+        # unicode dash variations often used as separators
+        for pattern, replacement in self._PLACEHOLDER_CLEANUPS:
+            text = pattern.sub(replacement, text)
         # Clean up multiple spaces and leading/trailing
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self._WHITESPACE_RE.sub(' ', text).strip()
         text = text.strip(' -–—,|•')
         return text
         
@@ -226,7 +276,7 @@ class EnhancedExperienceExtractor:
         text = text.replace('\r\n', '\n').replace('\r', '\n')
         
         # Strategy 1: Split by blank lines (most common)
-        paragraphs = re.split(r'\n\s*\n', text)
+        paragraphs = self._PARAGRAPH_BREAK_RE.split(text)
         
         # Group paragraphs that belong together (based on context)
         blocks = []
@@ -242,7 +292,7 @@ class EnhancedExperienceExtractor:
             is_new_entry = False
             
             # Check for date at start
-            if re.match(rf'^(?:{self.MONTH_NAMES}|\d{{1,2}}/)\s*\d{{4}}', para, re.IGNORECASE):
+            if self._LEADING_DATE_RE.match(para):
                 is_new_entry = True
             
             # Check for job title pattern at start
@@ -277,8 +327,7 @@ class EnhancedExperienceExtractor:
         # If we only got one block but text is long, try more aggressive splitting
         if len(blocks) <= 1 and len(text) > 500:
             # Try splitting by date ranges anywhere in lines
-            date_range_pattern = rf'\n(?=.*?{self.MONTH_NAMES}\s+\d{{4}}\s*(?:[-–—]|\bto\b)+)'
-            split_blocks = re.split(date_range_pattern, text, flags=re.IGNORECASE)
+            split_blocks = self._DATE_RANGE_LINE_RE.split(text)
             if len(split_blocks) > 1:
                 blocks = [b.strip() for b in split_blocks if len(b.strip()) > 30]
         
@@ -325,7 +374,7 @@ class EnhancedExperienceExtractor:
         for line in lines[:10]:
             line_clean = line.strip()
             # Pattern: "Title – Company" or "Title - Company"
-            match = re.match(r'^([A-Za-z][A-Za-z\s]+(?:Intern|Engineer|Developer|Manager|Analyst|Designer|Director|Lead|Specialist|Coordinator|Consultant|Associate|Assistant))\s*[–—-]\s*', line_clean, re.IGNORECASE)
+            match = self._TITLE_DASH_RE.match(line_clean)
             if match:
                 return match.group(1).strip()
         
@@ -339,21 +388,21 @@ class EnhancedExperienceExtractor:
                 continue
             
             # Skip phone numbers
-            if re.match(r'^[\+\d\s\-\(\)]+$', line_clean):
+            if self._PHONE_RE.match(line_clean):
                 continue
             
             # Check if line has dates - common format: "Title Dates" or "Company Dates Title"
-            if re.search(r'\b(19|20)\d{2}\b', line_clean):
+            if self._YEAR_RE.search(line_clean):
                 # Try to extract title from around the dates
                 # Pattern: dates followed by title
-                match = re.search(r'(?:to|[-–—])\s*((?:19|20)\d{2})\s+([A-Za-z][A-Za-z\s]+?)$', line_clean)
+                match = self._TITLE_AFTER_DATES_RE.search(line_clean)
                 if match:
                     potential_title = match.group(2).strip()
                     if len(potential_title) > 3 and self._is_likely_title(potential_title):
                         return potential_title
                 
                 # Pattern: title before dates
-                parts = re.split(r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?|\d{1,2}/)\s*\d{4}', line_clean, flags=re.IGNORECASE)
+                parts = self._DATE_SPLIT_RE.split(line_clean)
                 if parts and len(parts[0].strip()) > 3:
                     potential_title = parts[0].strip().strip(',-–—|')
                     if self._is_likely_title(potential_title):
@@ -365,7 +414,7 @@ class EnhancedExperienceExtractor:
                 continue
             
             # Skip location-only lines
-            if re.match(r'^[A-Z][a-z]+,?\s*[A-Z]{2}$', line_clean):  # City, ST format
+            if self._CITY_STATE_RE.match(line_clean):  # City, ST format
                 continue
             
             # Check for known job title keywords
@@ -378,9 +427,8 @@ class EnhancedExperienceExtractor:
         
         # Strategy 2: Search for known job titles in first half of the text
         search_text = '\n'.join(clean_lines[:min(10, len(clean_lines))])  # Only search first 10 lines
-        for title in self.JOB_TITLES:
-            pattern = rf'\b({re.escape(title)})\b'
-            match = re.search(pattern, search_text, re.IGNORECASE)
+        for title_re in self._JOB_TITLE_RES:
+            match = title_re.search(search_text)
             if match:
                 # Find the full line containing this title
                 start_pos = match.start()
@@ -392,10 +440,10 @@ class EnhancedExperienceExtractor:
                 full_line = search_text[line_start:line_end].strip()
                 
                 # Remove dates from the line
-                full_line = re.sub(rf'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{{4}}', '', full_line, flags=re.IGNORECASE)
-                full_line = re.sub(r'\b(19|20)\d{2}\b', '', full_line)
-                full_line = re.sub(r'\s*(?:[-–—]|\bto\b)+\s*(Present|Current|Now)?\s*', ' ', full_line, flags=re.IGNORECASE)
-                full_line = re.sub(r'\s+', ' ', full_line).strip()
+                full_line = self._MONTH_YEAR_RE.sub('', full_line)
+                full_line = self._YEAR_RE.sub('', full_line)
+                full_line = self._RANGE_TAIL_RE.sub(' ', full_line)
+                full_line = self._WHITESPACE_RE.sub(' ', full_line).strip()
                 
                 # Clean placeholder text
                 full_line = self._clean_placeholder_text(full_line)
@@ -472,10 +520,10 @@ class EnhancedExperienceExtractor:
         title_line = block[line_start:line_end].strip()
         
         # Clean the line
-        title_line = re.sub(rf'\b{self.MONTH_NAMES}\s+\d{{4}}', '', title_line, flags=re.IGNORECASE)
-        title_line = re.sub(r'\b(19|20)\d{2}\b', '', title_line)
-        title_line = re.sub(r'\s*[-–—to|]+\s*', ' ', title_line)
-        title_line = re.sub(r'\s+', ' ', title_line).strip()
+        title_line = self._MONTH_YEAR_RE.sub('', title_line)
+        title_line = self._YEAR_RE.sub('', title_line)
+        title_line = self._TITLE_SEPARATOR_RE.sub(' ', title_line)
+        title_line = self._WHITESPACE_RE.sub(' ', title_line).strip()
         
         return title_line if len(title_line) < 70 else block[start:end].title()
     
@@ -486,25 +534,23 @@ class EnhancedExperienceExtractor:
         for line in lines[:10]:
             line_clean = line.strip()
             # Pattern: "Title – Company Name" or "Title – Company (ABBREV)"
-            match = re.search(r'[–—-]\s*([A-Z][A-Za-z\s]+(?:\([A-Z]+\))?)\s*[,\n]?$', line_clean)
+            match = self._DASH_COMPANY_RE.search(line_clean)
             if match:
                 company = match.group(1).strip().rstrip(',')
                 if len(company) > 3 and not self._is_likely_title(company):
                     return company
             # Also check standalone company line with abbreviation: "Company Name (ABBREV)"
-            match = re.match(r'^([A-Z][A-Za-z\s]+)\s*\(([A-Z]{2,6})\)\s*$', line_clean)
+            match = self._COMPANY_ABBREV_RE.match(line_clean)
             if match:
                 return f"{match.group(1).strip()} ({match.group(2)})"
         
         # Pre-processing: Check for specific format "Company Name [Date to Date] Title"
         # This is a common template format where "Company Name" is literally the placeholder
-        company_date_pattern = rf'Company\s+Name\s+(?:{self.MONTH_NAMES}|\d{{1,2}}/)\s*\d{{4}}'
-        if re.search(company_date_pattern, block, re.IGNORECASE):
+        if self._COMPANY_NAME_DATE_RE.search(block):
             # This resume uses "Company Name" as a placeholder - look for real org names
             # Strategy: Look for organization names with parenthetical abbreviations like "Enterprise Resource Planning Office (ERO)"
-            paren_org_pattern = r'([A-Z][A-Za-z\s]+(?:Office|Department|Division|Center|Bureau|Agency|System|Service))\s*\(([A-Z]+)\)'
             for line in lines[:15]:
-                match = re.search(paren_org_pattern, line.strip())
+                match = self._OFFICE_ABBREV_RE.search(line.strip())
                 if match:
                     org_name = f"{match.group(1).strip()} ({match.group(2)})"
                     return org_name
@@ -512,7 +558,7 @@ class EnhancedExperienceExtractor:
             # Also try to find organization names with indicators
             for line in lines[:10]:
                 line_clean = line.strip()
-                if re.search(r'\b(?:Inc\.|Corp\.|LLC|Ltd\.|Hospital|University|College|Bank|Group|Institute)\b', line_clean, re.IGNORECASE):
+                if self._ORG_INDICATOR_RE.search(line_clean):
                     if not self._is_placeholder(line_clean):
                         company = self._clean_company_name(line_clean)
                         if company and len(company) > 3:
@@ -533,8 +579,7 @@ class EnhancedExperienceExtractor:
                     return company
         
         # Strategy 2: Look for "at Company" pattern
-        at_pattern = r'\bat\s+([A-Z][A-Za-z\s&,.\'-]+?)(?:\s*[,\n]|\s+(?:in|from|\d|' + self.MONTH_NAMES + '))'
-        match = re.search(at_pattern, block, re.IGNORECASE)
+        match = self._AT_COMPANY_RE.search(block)
         if match:
             company = self._clean_company_name(match.group(1))
             if company and len(company) > 2 and not self._is_likely_title(company) and not self._is_placeholder(company):
@@ -549,8 +594,7 @@ class EnhancedExperienceExtractor:
             
             if '(' in line and ')' in line:
                 # Organization name with abbreviation - broader pattern
-                paren_org_pattern = r'([A-Z][A-Za-z\s]+(?:Office|Department|Division|Center|Bureau|Agency|System|Service|Organization|Program))\s*\(([A-Z]{2,6})\)'
-                match = re.search(paren_org_pattern, line_stripped)
+                match = self._ORG_ABBREV_RE.search(line_stripped)
                 if match:
                     org_name = f"{match.group(1).strip()} ({match.group(2)})"
                     # Validate it's not a description
@@ -558,7 +602,7 @@ class EnhancedExperienceExtractor:
                         return org_name
                 
                 # General org pattern
-                match = re.match(r'([A-Z][A-Za-z\s]+)\s*\([A-Z]+\)', line_stripped)
+                match = self._GENERAL_ORG_RE.match(line_stripped)
                 if match:
                     company = self._clean_company_name(match.group(0))
                     if company and len(company) > 5 and not self._is_placeholder(company):
@@ -592,7 +636,7 @@ class EnhancedExperienceExtractor:
                 continue
             
             # Skip if it has dates
-            if re.search(r'\b(19|20)\d{2}\b', line_clean):
+            if self._YEAR_RE.search(line_clean):
                 continue
             
             # Skip if it looks like a job title
@@ -613,9 +657,8 @@ class EnhancedExperienceExtractor:
                         return company
         
         # Strategy 5: Look for "Company Name | Location" pattern
-        pipe_pattern = r'^([A-Z][A-Za-z\s&,.\'-]+?)\s*[|•]\s*[A-Z]'
         for line in lines[:5]:
-            match = re.match(pipe_pattern, line.strip())
+            match = self._PIPE_COMPANY_RE.match(line.strip())
             if match:
                 company = self._clean_company_name(match.group(1))
                 if company and len(company) > 2 and not self._is_placeholder(company):
@@ -628,13 +671,13 @@ class EnhancedExperienceExtractor:
         # First remove placeholder patterns
         text = self._clean_placeholder_text(text)
         # Remove common prefixes/suffixes
-        text = re.sub(r'^[\-–—•*\s]+', '', text)
-        text = re.sub(r'[\-–—•*\s]+$', '', text)
+        text = self._LEADING_BULLET_RE.sub('', text)
+        text = self._TRAILING_BULLET_RE.sub('', text)
         # Remove dates
-        text = re.sub(r'\b\d{4}\b', '', text)
-        text = re.sub(rf'\b{self.MONTH_NAMES}\b', '', text, flags=re.IGNORECASE)
+        text = self._FOUR_DIGITS_RE.sub('', text)
+        text = self._MONTH_WORD_RE.sub('', text)
         # Clean up
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self._WHITESPACE_RE.sub(' ', text).strip()
         text = text.strip(',-–—.')
         
         # Filter out text that looks like descriptions (has too many common verbs/action words)
@@ -679,8 +722,8 @@ class EnhancedExperienceExtractor:
     
     def _extract_location(self, block: str) -> Optional[str]:
         """Extract location from block"""
-        for pattern in self.LOCATION_PATTERNS:
-            match = re.search(pattern, block)
+        for pattern in self._LOCATION_RES:
+            match = pattern.search(block)
             if match:
                 groups = [g for g in match.groups() if g]
                 return ', '.join(groups)
@@ -688,7 +731,7 @@ class EnhancedExperienceExtractor:
     
     def _extract_dates(self, block: str) -> Tuple[Optional[date], Optional[date], bool]:
         """Extract start date, end date, and whether position is current"""
-        is_current = bool(re.search(r'\b(Present|Current|Now|Ongoing)\b', block, re.IGNORECASE))
+        is_current = bool(self._CURRENT_RE.search(block))
         
         # Month name to number mapping
         month_map = {
@@ -702,8 +745,7 @@ class EnhancedExperienceExtractor:
         end_date = None
         
         # Pattern 1: "Month Year - Month Year" or "Month Year - Present"
-        pattern1 = rf'({self.MONTH_NAMES})\s+(\d{{4}})\s*(?:[-–—]|\bto\b)+\s*(?:({self.MONTH_NAMES})\s+)?(\d{{4}}|Present|Current|Now)'
-        match = re.search(pattern1, block, re.IGNORECASE)
+        match = self._MONTH_RANGE_RE.search(block)
         if match:
             start_month = month_map.get(match.group(1).lower()[:3], 1)
             start_year = int(match.group(2))
@@ -719,8 +761,7 @@ class EnhancedExperienceExtractor:
             return start_date, end_date, is_current
         
         # Pattern 2: "MM/YYYY - MM/YYYY"
-        pattern2 = r'(\d{1,2})/(\d{4})\s*(?:[-–—]|\bto\b)+\s*(\d{1,2})?/?(\d{4}|Present|Current|Now)'
-        match = re.search(pattern2, block, re.IGNORECASE)
+        match = self._NUMERIC_RANGE_RE.search(block)
         if match:
             start_month = int(match.group(1))
             start_year = int(match.group(2))
@@ -738,8 +779,7 @@ class EnhancedExperienceExtractor:
             return start_date, end_date, is_current
         
         # Pattern 3: "YYYY - YYYY"
-        pattern3 = r'\b(\d{4})\s*(?:[-–—]|\bto\b)+\s*(\d{4}|Present|Current|Now)\b'
-        match = re.search(pattern3, block, re.IGNORECASE)
+        match = self._YEAR_RANGE_RE.search(block)
         if match:
             start_year = int(match.group(1))
             if 1900 <= start_year <= 2100:
@@ -760,21 +800,14 @@ class EnhancedExperienceExtractor:
         """Extract bullet points and achievements"""
         achievements = []
         
-        bullet_patterns = [
-            r'^[\s]*[•●○▪▫■□◦◘◙‣⁃⦾⦿]+\s*(.+)$',
-            r'^[\s]*[-–—]\s+(.+)$',
-            r'^[\s]*\*\s+(.+)$',
-            r'^[\s]*\d+[\.)]\s*(.+)$',
-        ]
-        
         lines = block.split('\n')
         for line in lines:
             line = line.strip()
             if len(line) < 15:
                 continue
             
-            for pattern in bullet_patterns:
-                match = re.match(pattern, line)
+            for pattern in self._BULLET_RES:
+                match = pattern.match(line)
                 if match:
                     text = match.group(1).strip()
                     if len(text) > 15:
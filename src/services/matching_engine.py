@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from typing import Dict, Any, List, Optional
 import json
+import numpy as np
 from datetime import datetime
 import time
 from uuid import uuid4
@@ -75,6 +76,7 @@ class MatchingEngine:
             self.logger.info("Match result cache disabled")
         
         # Initialize components
+        self.model_name = model_name
         self.embedding_generator = EmbeddingGenerator(model_name=model_name, enable_cache=enable_cache)
         self.vector_store = VectorStore(
             embedding_dim=self.embedding_generator.embedding_dim,
@@ -160,6 +162,67 @@ class MatchingEngine:
         else:
             self.logger.info("no_prebuilt_index_found")
     
+    def load_index_snapshot(self, name: str, signature: str) -> bool:
+        """
+        Replace the current index with a snapshot saved by save_index_snapshot
+        
+        Args:
+            name: Snapshot name
+            signature: Fingerprint of the content the snapshot was built from
+            
+        Returns:
+            True if the snapshot existed and was loaded
+        """
+        snapshot_dir = self.storage_path / "snapshots"
+        stem = f"{name}_{signature}"
+        if not (snapshot_dir / f"{stem}_index.faiss").exists():
+            return False
+        
+        try:
+            self.semantic_search.vector_store = VectorStore.load(
+                name=stem,
+                storage_dir=str(snapshot_dir),
+                mmap=True
+            )
+            self.vector_store = self.semantic_search.vector_store
+            self.stats['resumes_indexed'] = self.vector_store.size()
+            self.logger.info("index_snapshot_loaded", name=stem, index_size=self.vector_store.size())
+            return True
+        except Exception as e:
+            self.logger.error("index_snapshot_load_failed", name=stem, error=str(e))
+            return False
+    
+    def save_index_snapshot(self, name: str, signature: str):
+        """
+        Persist the current index so an identical corpus can skip re-embedding
+        
+        Only the latest snapshot per name is kept; files saved under the same
+        name with an older signature are removed, anything else is left alone.
+        
+        Args:
+            name: Snapshot name
+            signature: Fingerprint of the content the index was built from
+        """
+        snapshot_dir = self.storage_path / "snapshots"
+        snapshot_dir.mkdir(parents=True, exist_ok=True)
+        
+        stem = f"{name}_{signature}"
+        for old_file in snapshot_dir.glob(f"{name}_*"):
+            if not old_file.name.startswith(f"{stem}_"):
+                old_file.unlink(missing_ok=True)
+        
+        # Large corpora are trained into IVF-PQ once here, so requests that
+        # load the snapshot never retrain; no-op for small or trained indexes
+        self.vector_store.use_approximate_index()
+        
+        original_dir = self.vector_store.storage_dir
+        self.vector_store.storage_dir = snapshot_dir
+        try:
+            self.vector_store.save(stem)
+        finally:
+            self.vector_store.storage_dir = original_dir
+        self.logger.info("index_snapshot_saved", name=stem, index_size=self.vector_store.size())
+    
     def index_resume(self,
                     resume_data: Dict[str, Any],
                     resume_id: Optional[str] = None) -> str:
@@ -227,6 +290,20 @@ class MatchingEngine:
         
         return job_data
     
+    def embed_job(self, job_data: Dict[str, Any]) -> np.ndarray:
+        """
+        Compute the job vector find_matches searches with
+        
+        Args:
+            job_data: Parsed job description data
+            
+        Returns:
+            Job embedding to pass back as find_matches(job_embedding=...)
+        """
+        if hasattr(job_data, 'to_dict'):
+            job_data = job_data.to_dict()
+        return self.embedding_generator.encode_job_text(job_data)
+    
     @timed(logger=get_logger(__name__), event="find_matches")
     def find_matches(self,
                     job_data: Dict[str, Any],
@@ -234,7 +311,8 @@ class MatchingEngine:
                     min_score: Optional[float] = None,
                     filters: Optional[Dict[str, Any]] = None,
                     scoring_weights: Optional[Dict[str, float]] = None,
-                    use_cache: bool = None) -> List[Dict[str, Any]]:
+                    use_cache: bool = None,
+                    job_embedding: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Find matching candidates for a job with caching support
         
@@ -245,6 +323,8 @@ class MatchingEngine:
             filters: Optional filters (experience, skills, education, quality)
             scoring_weights: Custom scoring weights (semantic, skills, experience, education)
             use_cache: Override cache enable setting (default: use self.enable_cache)
+            job_embedding: Precomputed embed_job(job_data), e.g. when matching the
+                same job with different filters or weights
             
         Returns:
             List of ranked candidates with match details
@@ -284,7 +364,8 @@ class MatchingEngine:
         candidates = self.semantic_search.search_for_job(
             job_data=job_data,
             k=top_k,
-            filters=filters
+            filters=filters,
+            job_embedding=job_embedding
         )
         
         if not candidates:
@@ -17,7 +17,7 @@ except ImportError:
     HAS_PDFPLUMBER = False
 
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -41,6 +41,15 @@ class PDFExtractor:
         Returns:
             Extracted text content
         """
+        return self._extract_pymupdf(file_path)[0]
+    
+    def _extract_pymupdf(self, file_path: str) -> Tuple[str, Optional[Dict]]:
+        """
+        Extract text and metadata with PyMuPDF from a single open of the document
+        
+        Returns:
+            (text, metadata); metadata is None if extraction failed
+        """
         if not HAS_PYMUPDF:
             raise ImportError("PyMuPDF not available. Install with: pip install PyMuPDF")
         
@@ -50,6 +59,7 @@ class PDFExtractor:
             # Open PDF
             with fitz.open(file_path) as doc:
                 logger.info(f"Opening PDF: {file_path} ({doc.page_count} pages)")
+                metadata = self._metadata_from_doc(doc)
                 
                 # Extract text from each page
                 for page_num, page in enumerate(doc, start=1):
@@ -60,11 +70,11 @@ class PDFExtractor:
             
             full_text = "\n\n".join(text_content)
             logger.info(f"PyMuPDF: Extracted {len(full_text)} total characters")
-            return full_text
+            return full_text, metadata
             
         except Exception as e:
             logger.error(f"PyMuPDF extraction failed for {file_path}: {e}")
-            return ""
+            return "", None
     
     def extract_text_pdfplumber(self, file_path: str) -> str:
         """
@@ -112,7 +122,8 @@ class PDFExtractor:
                    'auto' tries PyMuPDF first, falls back to pdfplumber if needed
         
         Returns:
-            Dict with 'text' and 'method' keys
+            Dict with 'text' and 'method' keys, plus 'metadata' (see
+            get_metadata) when PyMuPDF already read it while extracting
         """
         file_path = str(Path(file_path).resolve())
         
@@ -127,8 +138,8 @@ class PDFExtractor:
         logger.info(f"Extracting text from PDF: {file_path}")
         
         if method == "pymupdf":
-            text = self.extract_text_pymupdf(file_path)
-            return {"text": text, "method": "pymupdf"}
+            text, metadata = self._extract_pymupdf(file_path)
+            return {"text": text, "method": "pymupdf", "metadata": metadata}
         
         elif method == "pdfplumber":
             text = self.extract_text_pdfplumber(file_path)
@@ -136,15 +147,15 @@ class PDFExtractor:
         
         elif method == "auto":
             # Try PyMuPDF first (faster)
-            text = self.extract_text_pymupdf(file_path)
+            text, metadata = self._extract_pymupdf(file_path)
             
             # If PyMuPDF returns empty or very short text, try pdfplumber
             if len(text.strip()) < 100:
                 logger.warning("PyMuPDF returned insufficient text, trying pdfplumber...")
                 text = self.extract_text_pdfplumber(file_path)
-                return {"text": text, "method": "pdfplumber"}
+                return {"text": text, "method": "pdfplumber", "metadata": metadata}
             
-            return {"text": text, "method": "pymupdf"}
+            return {"text": text, "method": "pymupdf", "metadata": metadata}
         
         else:
             raise ValueError(f"Unknown extraction method: {method}")
@@ -161,20 +172,24 @@ class PDFExtractor:
         """
         try:
             with fitz.open(file_path) as doc:
-                metadata = {
-                    "num_pages": doc.page_count,
-                    "title": doc.metadata.get("title", ""),
-                    "author": doc.metadata.get("author", ""),
-                    "subject": doc.metadata.get("subject", ""),
-                    "creator": doc.metadata.get("creator", ""),
-                    "producer": doc.metadata.get("producer", ""),
-                    "created_date": doc.metadata.get("creationDate", ""),
-                    "modified_date": doc.metadata.get("modDate", ""),
-                }
-                return metadata
+                return self._metadata_from_doc(doc)
         except Exception as e:
             logger.error(f"Failed to extract metadata from {file_path}: {e}")
             return {}
+    
+    @staticmethod
+    def _metadata_from_doc(doc) -> Dict:
+        """Metadata dict of an open PyMuPDF document"""
+        return {
+            "num_pages": doc.page_count,
+            "title": doc.metadata.get("title", ""),
+            "author": doc.metadata.get("author", ""),
+            "subject": doc.metadata.get("subject", ""),
+            "creator": doc.metadata.get("creator", ""),
+            "producer": doc.metadata.get("producer", ""),
+            "created_date": doc.metadata.get("creationDate", ""),
+            "modified_date": doc.metadata.get("modDate", ""),
+        }
 
 
 # Convenience function
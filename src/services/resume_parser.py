@@ -5,6 +5,7 @@ Unified parser for PDF and DOCX resume files
 
 from pathlib import Path
 from typing import Dict, Optional
+import hashlib
 import logging
 
 from .pdf_extractor import PDFExtractor, extract_text_from_pdf
@@ -16,10 +17,12 @@ from .quality_scorer import QualityScorer
 from .extractors.experience_extractor import ExperienceExtractor
 from .extractors.enhanced_experience_extractor import EnhancedExperienceExtractor
 
-# Import ML-based extractors
-from ..ml import HybridNameExtractor, SkillEmbedder, OrganizationExtractor, DynamicSkillExtractor
+# ML-based extractors (HybridNameExtractor, SkillEmbedder, ...) pull in torch and
+# sentence_transformers; they are imported in ResumeParser.__init__ only when
+# use_ml is enabled, so importing this module stays cheap
 from ..ml.enhanced_skill_extractor import EnhancedSkillExtractor
 from ..ml.experience_timeline import analyze_career_timeline
+from ..utils.json_utils import dump_json, load_json, write_bytes_atomic
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,9 @@ class ResumeParser:
     Main resume parser that handles multiple file formats
     """
     
+    # Bump whenever parse() output changes so cached results are invalidated
+    PARSER_VERSION = "1"
+    
     def __init__(self, detect_sections: bool = True, extract_contact: bool = True, extract_name: bool = True, assess_quality: bool = True, use_ml: bool = True):
         """Initialize resume parser with extractors"""
         self.pdf_extractor = PDFExtractor()
@@ -42,6 +48,7 @@ class ResumeParser:
         self.use_ml = use_ml
         if use_ml and extract_name:
             logger.info("Using ML-based extractors (name, skills, organizations)")
+            from ..ml import HybridNameExtractor, SkillEmbedder, OrganizationExtractor, DynamicSkillExtractor
             self.name_extractor = HybridNameExtractor()
             # Use both: Dynamic extractor for broad coverage + Semantic for matching
             self.dynamic_skill_extractor = DynamicSkillExtractor()
@@ -288,11 +295,95 @@ class ResumeParser:
             logger.error(f"Failed to parse {file_path}: {e}", exc_info=True)
             return self._create_error_result(file_path, str(e))
     
+    def parse_cached(self, file_path: str, cache_dir: str = "data/cache/parsed") -> Dict:
+        """
+        Parse resume file, reusing a previous result for identical content
+        
+        Results are stored as <cache_dir>/<sha256(file bytes + parser version)>.json,
+        so an unchanged file is never re-parsed. Failed parses are not cached.
+        A small pointer under <cache_dir>/by_stat/, keyed on (path, mtime, size),
+        lets reruns over untouched files skip reading and hashing them.
+        
+        Args:
+            file_path: Path to resume file
+            cache_dir: Directory holding cached parse results
+            
+        Returns:
+            Parse result dict (same shape as parse())
+        """
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return self.parse(str(file_path))
+        
+        # blake2b only keys the pointer file; it does not need to be sha256
+        stat_key = hashlib.blake2b(
+            f"{file_path.resolve()}:{stat.st_mtime_ns}:{stat.st_size}:{self.PARSER_VERSION}".encode(),
+            digest_size=16
+        ).hexdigest()
+        stat_file = Path(cache_dir) / "by_stat" / stat_key
+        
+        try:
+            content_key = stat_file.read_text(encoding='ascii').strip()
+        except OSError:
+            content_key = None
+        
+        if not content_key:
+            try:
+                digest = hashlib.sha256(file_path.read_bytes())
+            except OSError:
+                return self.parse(str(file_path))
+            digest.update(self.PARSER_VERSION.encode())
+            content_key = digest.hexdigest()
+        else:
+            stat_file = None  # pointer already recorded
+        
+        cache_file = Path(cache_dir) / f"{content_key}.json"
+        if cache_file.exists():
+            try:
+                result = load_json(cache_file)
+                # Same content may live under a different name/location
+                result['file_name'] = file_path.name
+                result['file_path'] = str(file_path.resolve())
+                self._write_stat_pointer(stat_file, content_key)
+                return result
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable parse cache {cache_file}: {e}")
+        
+        result = self.parse(str(file_path))
+        
+        if result.get('success'):
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                dump_json(result, cache_file, indent=False)
+                self._write_stat_pointer(stat_file, content_key)
+            except OSError as e:
+                logger.warning(f"Could not write parse cache {cache_file}: {e}")
+        
+        return result
+    
+    @staticmethod
+    def _write_stat_pointer(stat_file: Optional[Path], content_key: str) -> None:
+        """Record which content cache entry a (path, mtime, size) key maps to"""
+        if stat_file is None:
+            return
+        try:
+            stat_file.parent.mkdir(parents=True, exist_ok=True)
+            # Parallel parse workers may record the same pointer at once
+            write_bytes_atomic(stat_file, content_key.encode('ascii'))
+        except OSError as e:
+            logger.warning(f"Could not write parse cache pointer {stat_file}: {e}")
+    
     def _parse_pdf(self, file_path: Path) -> Dict:
         """Parse PDF file"""
         try:
             result = self.pdf_extractor.extract_text(str(file_path))
-            metadata = self.pdf_extractor.get_metadata(str(file_path))
+            # Text extraction normally reads the metadata from the same open
+            # document; only reopen the file when it could not
+            metadata = result.get('metadata')
+            if metadata is None:
+                metadata = self.pdf_extractor.get_metadata(str(file_path))
             
             success = len(result.get('text', '')) > 0
             
@@ -400,12 +491,13 @@ class ResumeParser:
             'metadata': {}
         }
     
-    def batch_parse(self, file_paths: list) -> Dict[str, Dict]:
+    def batch_parse(self, file_paths: list, cache_dir: Optional[str] = None) -> Dict[str, Dict]:
         """
         Parse multiple resume files
         
         Args:
             file_paths: List of file paths to parse
+            cache_dir: If given, reuse cached results keyed by file content
             
         Returns:
             Dict mapping file names to parse results
@@ -415,7 +507,10 @@ class ResumeParser:
         logger.info(f"Batch parsing {len(file_paths)} files")
         
         for file_path in file_paths:
-            result = self.parse(file_path)
+            if cache_dir:
+                result = self.parse_cached(file_path, cache_dir)
+            else:
+                result = self.parse(file_path)
             results[result['file_name']] = result
         
         # Log summary
@@ -426,15 +521,18 @@ class ResumeParser:
 
 
 # Convenience function
-def parse_resume(file_path: str) -> Dict:
+def parse_resume(file_path: str, cache_dir: Optional[str] = None) -> Dict:
     """
     Convenience function to parse a single resume
     
     Args:
         file_path: Path to resume file
+        cache_dir: If given, reuse cached results keyed by file content
     
     Returns:
         Parse result dict
     """
     parser = ResumeParser()
+    if cache_dir:
+        return parser.parse_cached(file_path, cache_dir)
     return parser.parse(file_path)
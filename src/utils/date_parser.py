@@ -10,9 +10,24 @@ from typing import Optional, Tuple
 from dateutil import parser as date_parser
 import dateparser
 
+try:
+    import re2  # google-re2: linear-time matching, no backtracking blow-up
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile_date_pattern(pattern: str):
+    """Compile a date pattern with RE2 when available, falling back to re"""
+    if re2 is not None:
+        try:
+            return re2.compile(f'(?i){pattern}')
+        except Exception:
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class DateParser:
     """
     Parse and normalize dates from various formats
@@ -30,9 +45,17 @@ class DateParser:
         r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—]\s*(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b',
         r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—]\s*(Present|Current|Now)\b',
     ]
+    _COMPILED_DATE_PATTERNS = tuple(map(_compile_date_pattern, DATE_PATTERNS))
     
     # Keywords indicating current/ongoing
     CURRENT_KEYWORDS = ['present', 'current', 'now', 'ongoing', 'today']
+    _CURRENT_RE = re.compile(r'\b(?:' + '|'.join(CURRENT_KEYWORDS) + r')\b', re.IGNORECASE)
+    
+    # MM/YYYY, handled without dateparser
+    _MONTH_YEAR_RE = re.compile(r'^(\d{1,2})/(\d{4})$')
+    
+    # Range separators: dashes, or "to" as a whole word (not inside "October")
+    _RANGE_SEPARATOR_RE = re.compile(r'\s*(?:[-–—]|\b(?:to|TO)\b)\s*')
     
     def __init__(self):
         """Initialize Date Parser"""
@@ -57,8 +80,23 @@ class DateParser:
         if date_string.lower() in self.CURRENT_KEYWORDS:
             return date.today()
         
+        # Fast paths for the most common shapes: YYYY-MM-DD, YYYY, MM/YYYY
+        if len(date_string) == 10 and date_string[4] == '-' and date_string[7] == '-':
+            try:
+                return date.fromisoformat(date_string)
+            except ValueError:
+                pass
+        elif len(date_string) == 4 and date_string.isdecimal() and date_string[0] in '12':
+            return date(int(date_string), 1, 1)
+        else:
+            month_year = self._MONTH_YEAR_RE.match(date_string)
+            if month_year and 1 <= int(month_year.group(1)) <= 12:
+                return date(int(month_year.group(2)), int(month_year.group(1)), 1)
+        
         try:
             # Try dateparser first (handles many formats)
+            # Relative dates ("2 months ago") resolve against the current time,
+            # so the settings are built per call, not once per parser
             parsed = dateparser.parse(
                 date_string,
                 settings={
@@ -105,16 +143,10 @@ class DateParser:
             return None, None, False
         
         # Check for current/ongoing position
-        is_current = any(keyword in text.lower() for keyword in self.CURRENT_KEYWORDS)
+        is_current = bool(self._CURRENT_RE.search(text))
         
-        # Split on common separators
-        separators = ['-', '–', '—', 'to', 'TO']
-        parts = [text]
-        
-        for sep in separators:
-            if sep in text:
-                parts = text.split(sep, 1)
-                break
+        # Split on the first range separator
+        parts = self._RANGE_SEPARATOR_RE.split(text, maxsplit=1)
         
         if len(parts) == 2:
             start_str = parts[0].strip()
@@ -148,9 +180,8 @@ class DateParser:
         """
         dates = []
         
-        for pattern in self.DATE_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern in self._COMPILED_DATE_PATTERNS:
+            for match in pattern.finditer(text):
                 date_str = match.group()
                 parsed_date = self.parse_date(date_str)
                 if parsed_date:
@@ -190,12 +221,8 @@ class DateParser:
         """
         if not start_date or not end_date:
             return None
-        
-        try:
-            months = (end_date.year - start_date.year) * 12 + (end_date.month - start_date.month)
-            return max(0, months)
-        except:
-            return None
+
+        return max(0, (end_date.year - start_date.year) * 12 + end_date.month - start_date.month)
     
     def calculate_duration_years(self, start_date: Optional[date], end_date: Optional[date]) -> Optional[float]:
         """
@@ -0,0 +1,65 @@
+"""
+File Scanning Utilities - Single-pass resume file discovery
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Union
+
+RESUME_EXTENSIONS = ('.pdf', '.doc', '.docx')
+
+
+def iter_resume_files(root: Union[str, Path],
+                      extensions: Tuple[str, ...] = RESUME_EXTENSIONS) -> Iterator[Path]:
+    """
+    Yield files under root whose suffix is in extensions (case-insensitive)
+
+    Walks the tree once with os.scandir instead of one recursive glob per
+    extension.
+
+    Args:
+        root: Directory to search recursively
+        extensions: Lowercase suffixes to match, including the dot
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_resume_files(entry.path, extensions)
+            else:
+                # Lowercased names are the norm; only lowercase the rest
+                name = entry.name
+                if name.endswith(extensions) or name.lower().endswith(extensions):
+                    yield Path(entry.path)
+
+
+def find_resume_files(root: Union[str, Path],
+                      extensions: Tuple[str, ...] = RESUME_EXTENSIONS) -> List[Path]:
+    """Sorted list of iter_resume_files(root, extensions)"""
+    return sorted(iter_resume_files(root, extensions))
+
+
+def list_subdirs(root: Union[str, Path]) -> Dict[str, Path]:
+    """
+    Map each immediate subdirectory name of root to its path
+
+    One scandir of root replaces an exists() check per expected subdirectory;
+    a missing root yields an empty dict.
+    """
+    try:
+        with os.scandir(root) as entries:
+            return {entry.name: Path(entry.path) for entry in entries if entry.is_dir()}
+    except FileNotFoundError:
+        return {}
+
+
+def read_ahead(path: Union[str, Path]) -> None:
+    """
+    Read a file and discard the bytes so it is in the OS page cache
+
+    Meant to run on a background thread for the next file in a sequential
+    parse loop; unreadable files are left for the parser to report.
+    """
+    try:
+        Path(path).read_bytes()
+    except OSError:
+        pass
@@ -9,6 +9,7 @@ except ImportError:
     
 from fastapi import HTTPException, UploadFile, status
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -49,24 +50,11 @@ def validate_file_upload(file: UploadFile) -> None:
             detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
         )
     
-    # Check file size (read first to get size)
+    # Check file size by seeking to the end instead of reading the upload into memory
     try:
-        contents = file.file.read()
-        file_size = len(contents)
+        file.file.seek(0, os.SEEK_END)
+        file_size = file.file.tell()
         file.file.seek(0)  # Reset file pointer
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024):.1f}MB"
-            )
-        
-        if file_size == 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File is empty"
-            )
-            
     except Exception as e:
         logger.error(f"Error reading file: {e}")
         raise HTTPException(
@@ -74,6 +62,18 @@ def validate_file_upload(file: UploadFile) -> None:
             detail="Error reading uploaded file"
         )
     
+    if file_size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024*1024):.1f}MB"
+        )
+    
+    if file_size == 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="File is empty"
+        )
+    
     logger.info(f"File validation passed: {filename} ({file_size / 1024:.1f}KB)")
 
 
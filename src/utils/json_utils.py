@@ -0,0 +1,92 @@
+"""
+JSON Utilities - Fast JSON file reading and writing
+Uses orjson when installed, falling back to the standard library
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_bytes_atomic(path: Union[str, Path], data: bytes) -> None:
+    """
+    Write data to path via a unique temp file in the same directory
+
+    The temp file is swapped in with os.replace, so readers never see a
+    partial file and concurrent writers of the same path (threads or
+    processes) never share a temp file; the last complete write wins.
+
+    Args:
+        path: Output file path
+        data: Bytes to write
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def dump_json(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """
+    Write obj to path as UTF-8 JSON, atomically (see write_bytes_atomic)
+
+    Non-ASCII text is written as-is (like ensure_ascii=False) and values that
+    are not JSON types are converted with str() (like default=str).
+
+    Args:
+        obj: Object to serialize
+        path: Output file path
+        indent: Pretty-print with 2-space indentation
+    """
+    data = None
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            data = orjson.dumps(obj, default=str, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; let the stdlib handle it
+            pass
+    
+    if data is None:
+        data = json.dumps(
+            obj, indent=2 if indent else None, ensure_ascii=False, default=str
+        ).encode("utf-8")
+    
+    write_bytes_atomic(path, data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    Read a UTF-8 JSON file
+
+    Args:
+        path: Input file path
+
+    Returns:
+        Parsed JSON value
+    """
+    data = Path(path).read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # e.g. NaN/Infinity or integers beyond 64 bits; let the stdlib handle it
+            pass
+    return json.loads(data)
@@ -11,35 +11,75 @@ from uuid import uuid4
 from pathlib import Path
 from functools import wraps
 import sys
+import threading
+import atexit
+
+import numpy as np
+
+# Last formatted UTC timestamp, refreshed at most once per second
+_ts_cache = [0, ""]
+
+
+def _now_iso() -> str:
+    """Current UTC time as ISO string, at second resolution"""
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[1] = datetime.utcfromtimestamp(t).isoformat()
+        _ts_cache[0] = t
+    return _ts_cache[1]
+
 
 class StructuredLogger:
-    """Structured JSON logger with request tracing and metrics"""
+    """Structured JSON logger with request tracing and metrics
     
-    def __init__(self, name: str = "intellimatch", log_dir: str = "logs"):
+    By default entries are written straight to a buffered JSON-lines file
+    and stdout, skipping LogRecord creation and handler dispatch. Pass
+    use_stdlib_logging=True to route through a logging.Logger instead
+    (for code that inspects or attaches handlers).
+    """
+    
+    # Buffered lines reach disk at least this often; WARNING and above are
+    # flushed as soon as they are written
+    FLUSH_INTERVAL_SECONDS = 1.0
+    
+    def __init__(self, name: str = "intellimatch", log_dir: str = "logs",
+                 use_stdlib_logging: bool = False):
         self.name = name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(exist_ok=True)
+        self.level = logging.INFO
         
-        # Create logger
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.INFO)
-        
-        # Remove existing handlers
-        self.logger.handlers.clear()
-        
-        # File handler - JSON format
         log_file = self.log_dir / f"{name}_{datetime.now().strftime('%Y%m%d')}.json"
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(JSONFormatter())
         
-        # Console handler - Human readable
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(HumanFormatter())
-        
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        if use_stdlib_logging:
+            self._fp = None
+            
+            # Create logger
+            self.logger = logging.getLogger(name)
+            self.logger.setLevel(self.level)
+            
+            # Remove existing handlers
+            self.logger.handlers.clear()
+            
+            # File handler - JSON format
+            file_handler = logging.FileHandler(log_file)
+            file_handler.setLevel(self.level)
+            file_handler.setFormatter(JSONFormatter())
+            
+            # Console handler - Human readable
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(self.level)
+            console_handler.setFormatter(HumanFormatter())
+            
+            self.logger.addHandler(file_handler)
+            self.logger.addHandler(console_handler)
+        else:
+            self.logger = None
+            self._fp = open(log_file, 'ab', buffering=64 * 1024)
+            self._lock = threading.Lock()
+            self._closed = threading.Event()
+            threading.Thread(target=self._flush_loop, name=f"{name}-log-flush", daemon=True).start()
+            atexit.register(self.close)
         
         # Context storage for request tracing
         self._context = {}
@@ -55,7 +95,7 @@ class StructuredLogger:
     def _build_log(self, level: str, event: str, **kwargs) -> Dict[str, Any]:
         """Build structured log entry"""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
             "level": level,
             "logger": self.name,
             "event": event,
@@ -64,25 +104,59 @@ class StructuredLogger:
         }
         return log_entry
     
+    def _emit(self, level: int, log_entry: Dict[str, Any]):
+        """Write one entry to the JSON log file and the console"""
+        if self._fp is None:
+            self.logger.log(level, json.dumps(log_entry))
+            return
+        if level < self.level:
+            return
+        
+        line = json.dumps(log_entry)
+        try:
+            console = HumanFormatter.format_entry(log_entry)
+        except Exception:
+            console = line
+        with self._lock:
+            self._fp.write((line + "\n").encode('utf-8'))
+            if level >= logging.WARNING:
+                self._fp.flush()
+            sys.stdout.write(console + "\n")
+    
+    def _flush_loop(self):
+        """Flush the buffer every FLUSH_INTERVAL_SECONDS until close()"""
+        while not self._closed.wait(self.FLUSH_INTERVAL_SECONDS):
+            self.flush()
+    
+    def flush(self):
+        """Flush buffered log lines to disk"""
+        if self._fp is not None:
+            with self._lock:
+                if not self._fp.closed:
+                    self._fp.flush()
+    
+    def close(self):
+        """Flush and close the log file"""
+        if self._fp is not None and not self._fp.closed:
+            self._closed.set()
+            with self._lock:
+                self._fp.close()
+    
     def info(self, event: str, **kwargs):
         """Log info level"""
-        log_entry = self._build_log("INFO", event, **kwargs)
-        self.logger.info(json.dumps(log_entry))
+        self._emit(logging.INFO, self._build_log("INFO", event, **kwargs))
     
     def warning(self, event: str, **kwargs):
         """Log warning level"""
-        log_entry = self._build_log("WARNING", event, **kwargs)
-        self.logger.warning(json.dumps(log_entry))
+        self._emit(logging.WARNING, self._build_log("WARNING", event, **kwargs))
     
     def error(self, event: str, **kwargs):
         """Log error level"""
-        log_entry = self._build_log("ERROR", event, **kwargs)
-        self.logger.error(json.dumps(log_entry))
+        self._emit(logging.ERROR, self._build_log("ERROR", event, **kwargs))
     
     def debug(self, event: str, **kwargs):
         """Log debug level"""
-        log_entry = self._build_log("DEBUG", event, **kwargs)
-        self.logger.debug(json.dumps(log_entry))
+        self._emit(logging.DEBUG, self._build_log("DEBUG", event, **kwargs))
 
 
 class JSONFormatter(logging.Formatter):
@@ -102,28 +176,32 @@ class HumanFormatter(logging.Formatter):
         'RESET': '\033[0m'
     }
     
+    @classmethod
+    def format_entry(cls, log_data: Dict[str, Any]) -> str:
+        """Render a structured log entry as one console line"""
+        level = log_data.get('level', 'INFO')
+        event = log_data.get('event', 'unknown')
+        timestamp = log_data.get('timestamp', '')
+        
+        # Build human-readable message
+        color = cls.COLORS.get(level, '')
+        reset = cls.COLORS['RESET']
+        
+        msg = f"{color}[{level}]{reset} {timestamp[:19]} | {event}"
+        
+        # Add important fields
+        if 'request_id' in log_data:
+            msg += f" | req_id={log_data['request_id'][:8]}"
+        if 'duration_ms' in log_data:
+            msg += f" | {log_data['duration_ms']:.1f}ms"
+        if 'error' in log_data:
+            msg += f" | error={log_data['error']}"
+        
+        return msg
+    
     def format(self, record):
         try:
-            log_data = json.loads(record.getMessage())
-            level = log_data.get('level', 'INFO')
-            event = log_data.get('event', 'unknown')
-            timestamp = log_data.get('timestamp', '')
-            
-            # Build human-readable message
-            color = self.COLORS.get(level, '')
-            reset = self.COLORS['RESET']
-            
-            msg = f"{color}[{level}]{reset} {timestamp[:19]} | {event}"
-            
-            # Add important fields
-            if 'request_id' in log_data:
-                msg += f" | req_id={log_data['request_id'][:8]}"
-            if 'duration_ms' in log_data:
-                msg += f" | {log_data['duration_ms']:.1f}ms"
-            if 'error' in log_data:
-                msg += f" | error={log_data['error']}"
-            
-            return msg
+            return self.format_entry(json.loads(record.getMessage()))
         except:
             return record.getMessage()
 
@@ -173,45 +251,53 @@ def get_logger(name: str = "intellimatch") -> StructuredLogger:
 class MetricsCollector:
     """Collect and aggregate performance metrics"""
     
+    # Values live in growable float64 buffers (doubled on overflow) so
+    # percentile stats sort packed floats instead of a list of dicts
+    INITIAL_CAPACITY = 1024
+    
     def __init__(self):
-        self.metrics = {
-            'embedding_generation': [],
-            'vector_search': [],
-            'matching': [],
-            'skill_extraction': []
-        }
+        self.metrics: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, int] = {}
+        for name in ('embedding_generation', 'vector_search', 'matching', 'skill_extraction'):
+            self._add_metric(name)
+    
+    def _add_metric(self, metric_name: str):
+        self.metrics[metric_name] = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._counts[metric_name] = 0
     
     def record(self, metric_name: str, value: float):
         """Record a metric value"""
         if metric_name not in self.metrics:
-            self.metrics[metric_name] = []
-        self.metrics[metric_name].append({
-            'value': value,
-            'timestamp': datetime.utcnow().isoformat()
-        })
+            self._add_metric(metric_name)
+        buffer = self.metrics[metric_name]
+        n = self._counts[metric_name]
+        if n == len(buffer):
+            buffer = np.concatenate([buffer, np.empty_like(buffer)])
+            self.metrics[metric_name] = buffer
+        buffer[n] = value
+        self._counts[metric_name] = n + 1
     
     def get_stats(self, metric_name: str) -> Dict[str, float]:
         """Get statistics for a metric"""
-        values = [m['value'] for m in self.metrics.get(metric_name, [])]
-        if not values:
+        n = self._counts.get(metric_name, 0)
+        if not n:
             return {}
         
-        values.sort()
-        n = len(values)
+        values = np.sort(self.metrics[metric_name][:n])
         return {
             'count': n,
-            'min': min(values),
-            'max': max(values),
-            'mean': sum(values) / n,
-            'p50': values[n // 2],
-            'p95': values[int(n * 0.95)] if n > 1 else values[0],
-            'p99': values[int(n * 0.99)] if n > 1 else values[0]
+            'min': float(values[0]),
+            'max': float(values[-1]),
+            'mean': float(values.mean()),
+            'p50': float(values[n // 2]),
+            'p95': float(values[int(n * 0.95)]),
+            'p99': float(values[int(n * 0.99)])
         }
     
     def reset(self):
         """Reset all metrics"""
-        for key in self.metrics:
-            self.metrics[key] = []
+        for key in self._counts:
+            self._counts[key] = 0
     
     def get_all_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics for all metrics"""
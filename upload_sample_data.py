@@ -3,10 +3,25 @@ Upload sample resumes and jobs to the database via API
 """
 import requests
 import json
+import socket
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 BASE_URL = "http://localhost:8000/api/v1"
 
+# One session per upload thread: each reuses its own keep-alive connection,
+# and requests.Session is not documented as thread-safe
+_thread_local = threading.local()
+
+def get_session() -> requests.Session:
+    """Return this thread's requests.Session, creating it on first use"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
 # Sample resumes
 sample_resumes = [
     {
@@ -98,44 +113,66 @@ sample_jobs = [
     }
 ]
 
-def upload_data():
-    """Upload sample data to the API"""
-    
-    print("=" * 70)
-    print("📤 Uploading Sample Data to IntelliMatch AI")
-    print("=" * 70)
-    
-    # Upload resumes
-    print("\n1️⃣  Uploading Resumes...")
+def upload_resumes():
+    """Upload sample resumes; returns (resume ids, report lines)"""
+    session = get_session()
     resume_ids = []
+    lines = []
     for i, resume in enumerate(sample_resumes, 1):
         try:
-            response = requests.post(f"{BASE_URL}/resumes/", json=resume)
+            response = session.post(f"{BASE_URL}/resumes/", json=resume)
             if response.status_code in [200, 201]:
                 data = response.json()
                 resume_id = data.get('id')
                 resume_ids.append(resume_id)
-                print(f"   ✅ {i}. {resume['candidate_name']} (ID: {resume_id})")
+                lines.append(f"   ✅ {i}. {resume['candidate_name']} (ID: {resume_id})")
             else:
-                print(f"   ❌ {i}. {resume['candidate_name']} - Error: {response.status_code}")
+                lines.append(f"   ❌ {i}. {resume['candidate_name']} - Error: {response.status_code}")
         except Exception as e:
-            print(f"   ❌ {i}. {resume['candidate_name']} - Error: {e}")
-    
-    # Upload jobs
-    print("\n2️⃣  Uploading Jobs...")
+            lines.append(f"   ❌ {i}. {resume['candidate_name']} - Error: {e}")
+    return resume_ids, lines
+
+def upload_jobs():
+    """Upload sample jobs; returns (job ids, report lines)"""
+    session = get_session()
     job_ids = []
+    lines = []
     for i, job in enumerate(sample_jobs, 1):
         try:
-            response = requests.post(f"{BASE_URL}/jobs/", json=job)
+            response = session.post(f"{BASE_URL}/jobs/", json=job)
             if response.status_code in [200, 201]:
                 data = response.json()
                 job_id = data.get('id')
                 job_ids.append(job_id)
-                print(f"   ✅ {i}. {job['title']} at {job['company']} (ID: {job_id})")
+                lines.append(f"   ✅ {i}. {job['title']} at {job['company']} (ID: {job_id})")
             else:
-                print(f"   ❌ {i}. {job['title']} - Error: {response.status_code}")
+                lines.append(f"   ❌ {i}. {job['title']} - Error: {response.status_code}")
         except Exception as e:
-            print(f"   ❌ {i}. {job['title']} - Error: {e}")
+            lines.append(f"   ❌ {i}. {job['title']} - Error: {e}")
+    return job_ids, lines
+
+def upload_data():
+    """Upload sample data to the API"""
+    
+    print("=" * 70)
+    print("📤 Uploading Sample Data to IntelliMatch AI")
+    print("=" * 70)
+    
+    # Resumes and jobs are independent, so upload both at once; output is
+    # collected and printed in order afterwards
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        resumes_future = executor.submit(upload_resumes)
+        jobs_future = executor.submit(upload_jobs)
+        resume_ids, resume_lines = resumes_future.result()
+        job_ids, job_lines = jobs_future.result()
+    
+    print("\n1️⃣  Uploading Resumes...")
+    for line in resume_lines:
+        print(line)
+    
+    print("\n2️⃣  Uploading Jobs...")
+    for line in job_lines:
+        print(line)
     
     # Summary
     print("\n" + "=" * 70)
@@ -146,21 +183,33 @@ def upload_data():
     
     return resume_ids, job_ids
 
-if __name__ == "__main__":
+def backend_reachable() -> bool:
+    """
+    Check that the backend is listening with a bare TCP connect, without
+    dispatching a request to it; connection errors are reported here
+    """
+    api_url = urlparse(BASE_URL)
     try:
-        # Check if backend is running
-        response = requests.get(f"{BASE_URL.replace('/api/v1', '')}/")
-        print(f"✅ Backend is running: {response.json()['message']}\n")
-        
-        resume_ids, job_ids = upload_data()
-        
-        print("\n💡 Next steps:")
-        print(f"   - View resumes: http://localhost:8000/api/v1/resumes/")
-        print(f"   - View jobs: http://localhost:8000/api/v1/jobs/")
-        print(f"   - API docs: http://localhost:8000/docs")
-        
-    except requests.exceptions.ConnectionError:
-        print("❌ Error: Backend is not running!")
+        socket.create_connection((api_url.hostname, api_url.port or 80), timeout=1.0).close()
+    except OSError as e:
+        print(f"❌ Error: Backend is not running! ({api_url.netloc}: {e})")
         print("   Start it with: python start_server.py")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+        return False
+    print(f"✅ Backend is reachable at {api_url.netloc}\n")
+    return True
+
+if __name__ == "__main__":
+    if backend_reachable():
+        try:
+            resume_ids, job_ids = upload_data()
+            
+            print("\n💡 Next steps:")
+            print(f"   - View resumes: http://localhost:8000/api/v1/resumes/")
+            print(f"   - View jobs: http://localhost:8000/api/v1/jobs/")
+            print(f"   - API docs: http://localhost:8000/docs")
+            
+        except requests.exceptions.ConnectionError:
+            print("❌ Error: Lost connection to the backend!")
+            print("   Start it with: python start_server.py")
+        except Exception as e:
+            print(f"❌ Error: {e}")